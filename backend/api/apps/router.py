@@ -1,14 +1,20 @@
-from django.db.models import Count, Q
 from django.http import HttpRequest
 from ninja import File
 from ninja.files import UploadedFile
 from ninja import Router
 
 from apps.auth.services import ApiKeyService
-from apps.projects.services import AppService, EnvironmentService
+from apps.projects.services import (
+    AnalyticsService,
+    AppService,
+    ConsumerStatsService,
+    EndpointStatsService,
+    EnvironmentService,
+    LogsService,
+)
 from apps.users.models import User
 from core.auth.authentication import jwt_auth
-from core.exceptions.base import ValidationError
+from core.exceptions.base import NotFoundError, ValidationError
 
 from .schemas import (
     AppListResponse,
@@ -84,16 +90,7 @@ def _parse_loggers(raw_values: list[str]) -> list[str]:
 def create_app(request: HttpRequest, data: CreateAppRequest):
     user: User = request.auth
     app = AppService.create_app(user, data.name, data.description, data.framework)
-    return 201, AppResponse(
-        id=app.id,
-        name=app.name,
-        slug=app.slug,
-        icon_url=_build_app_icon_url(app),
-        description=app.description,
-        framework=app.framework,
-        created_at=app.created_at,
-        updated_at=app.updated_at,
-    )
+    return 201, app
 
 
 @router.get("/", response=list[AppListResponse])
@@ -101,65 +98,21 @@ def list_apps(request: HttpRequest):
     user: User = request.auth
     apps = AppService.list_apps(user)
 
-    # Annotate with active key count
-    from apps.projects.models import App
-    app_ids = [a.id for a in apps]
-    counts = dict(
-        App.objects.filter(id__in=app_ids)
-        .annotate(
-            key_count=Count(
-                "api_keys",
-                filter=Q(api_keys__is_revoked=False),
-            )
-        )
-        .values_list("id", "key_count")
-    )
-
-    return [
-        AppListResponse(
-            id=a.id,
-            name=a.name,
-            slug=a.slug,
-            icon_url=_build_app_icon_url(a),
-            description=a.description,
-            framework=a.framework,
-            api_key_count=counts.get(a.id, 0),
-            created_at=a.created_at,
-        )
-        for a in apps
-    ]
+    return apps
 
 
 @router.get("/{app_slug}", response=AppResponse)
 def get_app(request: HttpRequest, app_slug: str):
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
-    return AppResponse(
-        id=app.id,
-        name=app.name,
-        slug=app.slug,
-        icon_url=_build_app_icon_url(app),
-        description=app.description,
-        framework=app.framework,
-        created_at=app.created_at,
-        updated_at=app.updated_at,
-    )
+    return app
 
 
 @router.patch("/{app_slug}", response=AppResponse)
 def update_app(request: HttpRequest, app_slug: str, data: UpdateAppRequest):
     user: User = request.auth
     app = AppService.update_app(user, app_slug, data.name, data.description, data.framework)
-    return AppResponse(
-        id=app.id,
-        name=app.name,
-        slug=app.slug,
-        icon_url=_build_app_icon_url(app),
-        description=app.description,
-        framework=app.framework,
-        created_at=app.created_at,
-        updated_at=app.updated_at,
-    )
+    return app
 
 
 @router.delete("/{app_slug}", response=MessageResponse)
@@ -174,10 +127,7 @@ def upload_app_icon(request: HttpRequest, app_slug: str, file: UploadedFile = Fi
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
     app = AppService.update_icon(app, file)
-    return AppIconResponse(
-        icon_url=_build_app_icon_url(app),
-        message="App icon updated",
-    )
+    return {"icon_url": _build_app_icon_url(app), "message": "App icon updated"}
 
 
 @router.delete("/{app_slug}/icon", response=MessageResponse)
@@ -198,13 +148,13 @@ def create_api_key(request: HttpRequest, app_slug: str, data: CreateApiKeyReques
     if not data.name or not data.name.strip():
         raise ValidationError("API key name is required")
     raw_key, api_key = ApiKeyService.create_key(app, data.name.strip())
-    return 201, CreateApiKeyResponse(
-        key=raw_key,
-        id=api_key.id,
-        name=api_key.name,
-        prefix=api_key.prefix,
-        created_at=api_key.created_at,
-    )
+    return 201, {
+        "key": raw_key,
+        "id": api_key.id,
+        "name": api_key.name,
+        "prefix": api_key.prefix,
+        "created_at": api_key.created_at,
+    }
 
 
 @router.get("/{app_slug}/api-keys", response=list[ApiKeyResponse])
@@ -212,23 +162,13 @@ def list_api_keys(request: HttpRequest, app_slug: str):
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
     keys = ApiKeyService.list_keys(app)
-    return [
-        ApiKeyResponse(
-            id=k.id,
-            name=k.name,
-            prefix=k.prefix,
-            last_used_at=k.last_used_at,
-            created_at=k.created_at,
-        )
-        for k in keys
-    ]
+    return keys
 
 
 @router.delete("/{app_slug}/api-keys/{key_id}", response=MessageResponse)
 def revoke_api_key(request: HttpRequest, app_slug: str, key_id: str):
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
-    from core.exceptions.base import NotFoundError
     revoked = ApiKeyService.revoke_key(app, key_id)
     if not revoked:
         raise NotFoundError("API key not found")
@@ -243,7 +183,7 @@ def list_environments(request: HttpRequest, app_slug: str):
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
     envs = EnvironmentService.list_environments(app)
-    return [EnvironmentResponse.from_orm(e) for e in envs]
+    return envs
 
 
 # ── App-scoped Endpoint Stats ────────────────────────────────────────
@@ -271,7 +211,6 @@ def get_endpoint_stats(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import EndpointStatsService
     status_class_list: list[str] = []
     if status_classes:
         status_class_list.extend([s.strip() for s in status_classes.split(",") if s.strip()])
@@ -345,7 +284,6 @@ def get_endpoint_options(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import EndpointStatsService
     status_class_list: list[str] = []
     if status_classes:
         status_class_list.extend([s.strip() for s in status_classes.split(",") if s.strip()])
@@ -391,7 +329,6 @@ def get_endpoint_meta(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import EndpointStatsService
     return EndpointStatsService.get_endpoint_meta(
         app_id=str(app.id),
         endpoint_id=endpoint_id,
@@ -409,7 +346,6 @@ def get_environment_options(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import EndpointStatsService
     return EndpointStatsService.get_environment_options(
         app_id=str(app.id),
         since=since,
@@ -430,7 +366,6 @@ def get_consumer_stats(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import ConsumerStatsService
     return ConsumerStatsService.get_consumer_stats(
         app_id=str(app.id),
         environment=environment,
@@ -453,7 +388,6 @@ def get_consumer_request_stats(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import ConsumerStatsService
     return ConsumerStatsService.get_consumer_request_stats(
         app_id=str(app.id),
         consumer=consumer,
@@ -479,7 +413,6 @@ def get_consumer_activity(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import ConsumerStatsService
     return ConsumerStatsService.get_consumer_activity(
         app_id=str(app.id),
         consumer=consumer,
@@ -513,7 +446,6 @@ def get_logs(
     attr_filters = _parse_log_attr_filters(request.GET.getlist("attr"))
     logger_filters = _parse_loggers(request.GET.getlist("logger"))
 
-    from apps.projects.services import LogsService
     return LogsService.get_logs(
         app_id=str(app.id),
         environment=environment,
@@ -547,7 +479,6 @@ def get_logs_summary(
     attr_filters = _parse_log_attr_filters(request.GET.getlist("attr"))
     logger_filters = _parse_loggers(request.GET.getlist("logger"))
 
-    from apps.projects.services import LogsService
     return LogsService.get_logs_summary(
         app_id=str(app.id),
         environment=environment,
@@ -580,7 +511,6 @@ def get_logs_timeseries(
     attr_filters = _parse_log_attr_filters(request.GET.getlist("attr"))
     logger_filters = _parse_loggers(request.GET.getlist("logger"))
 
-    from apps.projects.services import LogsService
     return LogsService.get_logs_timeseries(
         app_id=str(app.id),
         environment=environment,
@@ -608,7 +538,6 @@ def get_logs_search_options(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import LogsService
     return LogsService.get_logs_search_options(
         app_id=str(app.id),
         environment=environment,
@@ -631,7 +560,6 @@ def get_analytics_summary(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import AnalyticsService
     return AnalyticsService.get_summary(
         app_id=str(app.id),
         environment=environment,
@@ -651,7 +579,6 @@ def get_analytics_timeseries(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import AnalyticsService
     return AnalyticsService.get_timeseries(
         app_id=str(app.id),
         environment=environment,
@@ -672,7 +599,6 @@ def get_analytics_related_apis(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import AnalyticsService
     return AnalyticsService.get_related_apis(
         app_id=str(app.id),
         environment=environment,
@@ -695,7 +621,6 @@ def get_analytics_endpoint_detail(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import AnalyticsService
     return AnalyticsService.get_endpoint_detail(
         app_id=str(app.id),
         method=method,
@@ -719,7 +644,6 @@ def get_analytics_endpoint_timeseries(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import AnalyticsService
     return AnalyticsService.get_endpoint_timeseries(
         app_id=str(app.id),
         method=method,
@@ -744,7 +668,6 @@ def get_analytics_endpoint_consumers(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import AnalyticsService
     return AnalyticsService.get_endpoint_consumers(
         app_id=str(app.id),
         method=method,
@@ -770,7 +693,6 @@ def get_analytics_endpoint_status_codes(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import AnalyticsService
     return AnalyticsService.get_endpoint_status_codes(
         app_id=str(app.id),
         method=method,
@@ -796,7 +718,6 @@ def get_analytics_endpoint_payloads(
     user: User = request.auth
     app = AppService.get_app_by_slug(user, app_slug)
 
-    from apps.projects.services import AnalyticsService
     return AnalyticsService.get_endpoint_payloads(
         app_id=str(app.id),
         method=method,
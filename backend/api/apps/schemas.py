@@ -1,13 +1,11 @@
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Literal
 from uuid import UUID
 
-import os
-
-from django.conf import settings
 from ninja import Schema
 
 from apps.projects.models import App
+from core.utils.media import build_media_url
 
 FrameworkValue = Literal["fastapi", "flask", "django", "starlette", "express"]
 
@@ -15,9 +13,7 @@ FrameworkValue = Literal["fastapi", "flask", "django", "starlette", "express"]
 def _build_app_icon_url(app: App) -> str:
     if not app.icon_image:
         return ""
-    base = os.environ.get("DJANGO_BASE_URL", "http://localhost:8000")
-    cache_bust = int(app.updated_at.timestamp()) if app.updated_at else ""
-    return f"{base}{settings.MEDIA_URL}{app.icon_image.name}?v={cache_bust}"
+    return build_media_url(app.icon_image.name, app.updated_at)
 
 
 class CreateAppRequest(Schema):
@@ -27,9 +23,9 @@ class CreateAppRequest(Schema):
 
 
 class UpdateAppRequest(Schema):
-    name: Optional[str] = None
-    description: Optional[str] = None
-    framework: Optional[FrameworkValue] = None
+    name: str | None = None
+    description: str | None = None
+    framework: FrameworkValue | None = None
 
 
 class AppResponse(Schema):
@@ -42,6 +38,10 @@ class AppResponse(Schema):
     created_at: datetime
     updated_at: datetime
 
+    @staticmethod
+    def resolve_icon_url(obj: App) -> str:
+        return _build_app_icon_url(obj)
+
 
 class AppListResponse(Schema):
     id: UUID
@@ -53,6 +53,10 @@ class AppListResponse(Schema):
     api_key_count: int
     created_at: datetime
 
+    @staticmethod
+    def resolve_icon_url(obj: App) -> str:
+        return _build_app_icon_url(obj)
+
 
 class CreateApiKeyRequest(Schema):
     name: str
@@ -62,7 +66,7 @@ class ApiKeyResponse(Schema):
     id: UUID
     name: str
     prefix: str
-    last_used_at: Optional[datetime] = None
+    last_used_at: datetime | None = None
     created_at: datetime
 
 
@@ -93,9 +97,9 @@ class CreateEndpointRequest(Schema):
 
 
 class UpdateEndpointRequest(Schema):
-    path: Optional[str] = None
-    method: Optional[str] = None
-    description: Optional[str] = None
+    path: str | None = None
+    method: str | None = None
+    description: str | None = None
 
 
 class EndpointResponse(Schema):
@@ -104,7 +108,7 @@ class EndpointResponse(Schema):
     method: str
     description: str
     is_active: bool
-    last_seen_at: Optional[datetime] = None
+    last_seen_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -118,8 +122,8 @@ class CreateEnvironmentRequest(Schema):
 
 
 class UpdateEnvironmentRequest(Schema):
-    name: Optional[str] = None
-    color: Optional[str] = None
+    name: str | None = None
+    color: str | None = None
 
 
 class EnvironmentResponse(Schema):
@@ -136,7 +140,7 @@ class EnvironmentResponse(Schema):
 
 
 class EndpointStatsResponse(Schema):
-    endpoint_id: Optional[str] = None
+    endpoint_id: str | None = None
     method: str
     path: str
     total_requests: int
@@ -146,7 +150,7 @@ class EndpointStatsResponse(Schema):
     p95_response_time_ms: float
     total_request_bytes: int
     total_response_bytes: int
-    last_seen_at: Optional[datetime] = None
+    last_seen_at: datetime | None = None
 
 
 class EndpointStatsListResponse(Schema):
@@ -177,7 +181,7 @@ class ConsumerStatsResponse(Schema):
     error_count: int
     error_rate: float
     avg_response_time_ms: float
-    last_seen_at: Optional[datetime] = None
+    last_seen_at: datetime | None = None
 
 
 class ConsumerRequestStatsResponse(Schema):
@@ -188,7 +192,7 @@ class ConsumerRequestStatsResponse(Schema):
     error_count: int
     error_rate: float
     avg_response_time_ms: float
-    last_seen_at: Optional[datetime] = None
+    last_seen_at: datetime | None = None
 
 
 class ConsumerActivityResponse(Schema):
@@ -247,7 +251,7 @@ class EndpointDetailResponse(Schema):
     p95_response_time_ms: float
     total_request_bytes: int
     total_response_bytes: int
-    last_seen_at: Optional[datetime] = None
+    last_seen_at: datetime | None = None
 
 
 class EndpointTimeseriesPointResponse(Schema):
@@ -1,13 +1,18 @@
-from typing import Optional
 from uuid import UUID
 from datetime import datetime
 
 from ninja import Schema
+from pydantic import field_validator
 
 
 class MagicLinkRequest(Schema):
     email: str
-    flow: Optional[str] = None
+    flow: str | None = None
+
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, value: str) -> str:
+        return value.strip().lower()
 
 
 class PasswordLoginRequest(Schema):
@@ -15,6 +20,11 @@ class PasswordLoginRequest(Schema):
     password: str
     remember_me: bool = True
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, value: str) -> str:
+        return value.strip().lower()
+
 
 class VerifyRequest(Schema):
     token: str
@@ -52,6 +62,6 @@ class MessageResponse(Schema):
 class SessionResponse(Schema):
     id: UUID
     device_info: str
-    ip_address: Optional[str] = None
+    ip_address: str | None = None
     last_used_at: datetime
     created_at: datetime
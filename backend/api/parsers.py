@@ -0,0 +1,34 @@
+import json
+import zlib
+from typing import Any
+
+from django.conf import settings
+from django.http import HttpRequest
+from ninja.parser import Parser
+
+
+class JSONParser(Parser):
+    """Default JSON parser that also accepts gzip-encoded request bodies.
+
+    The SDK compresses ingest batches; decompressed bodies are held to the
+    same DATA_UPLOAD_MAX_MEMORY_SIZE limit Django applies to plain ones.
+    """
+
+    def parse_body(self, request: HttpRequest) -> Any:
+        body = request.body
+        if request.META.get("HTTP_CONTENT_ENCODING", "").strip().lower() == "gzip":
+            body = _gunzip(body, settings.DATA_UPLOAD_MAX_MEMORY_SIZE)
+        return json.loads(body)
+
+
+def _gunzip(data: bytes, limit: int | None) -> bytes:
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    if limit is None:
+        body = decompressor.decompress(data)
+    else:
+        body = decompressor.decompress(data, limit + 1)
+        if len(body) > limit:
+            raise ValueError("Decompressed request body exceeds the size limit")
+    if not decompressor.eof:
+        raise ValueError("Truncated gzip request body")
+    return body
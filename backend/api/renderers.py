@@ -0,0 +1,27 @@
+from typing import Any
+
+import orjson
+from django.http import HttpRequest
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+
+# Datetimes go through Ninja's encoder so the wire format stays the
+# millisecond-precision ISO string clients already parse; orjson's native
+# output would switch to microseconds.
+_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONRenderer(BaseRenderer):
+    """JSON renderer backed by orjson.
+
+    UUIDs are serialized natively; datetimes and anything orjson does not
+    know (Decimal, lazy strings, pydantic models) fall back to Ninja's
+    encoder.
+    """
+
+    media_type = "application/json"
+
+    _fallback = NinjaJSONEncoder().default
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> bytes:
+        return orjson.dumps(data, default=self._fallback, option=_OPTIONS)
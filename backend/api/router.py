@@ -2,19 +2,47 @@ import logging
 
 from ninja import NinjaAPI
 from ninja.errors import AuthenticationError, ValidationError
+from django.conf import settings
 from django.http import HttpRequest, HttpResponse
 from django.db import IntegrityError, DatabaseError
 
 from core.exceptions.base import AppError
 
+from .parsers import JSONParser
+from .renderers import ORJSONRenderer
+
 logger = logging.getLogger(__name__)
 
-api = NinjaAPI(
+
+class APILensNinjaAPI(NinjaAPI):
+    """NinjaAPI that builds the OpenAPI schema once per path prefix.
+
+    Routes are fixed after startup, so walking every operation and schema
+    again on each /openapi.json request is wasted work.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._openapi_schema_cache: dict[str, dict] = {}
+
+    def get_openapi_schema(self, *, path_prefix=None, path_params=None):
+        if path_prefix is None:
+            path_prefix = self.get_root_path(path_params or {})
+        schema = self._openapi_schema_cache.get(path_prefix)
+        if schema is None:
+            schema = super().get_openapi_schema(path_prefix=path_prefix)
+            self._openapi_schema_cache[path_prefix] = schema
+        return schema
+
+
+api = APILensNinjaAPI(
     title="APILens API",
     version="1.0.0",
     description="API Observability Platform",
-    docs_url="/docs",
-    openapi_url="/openapi.json",
+    docs_url="/docs" if settings.API_DOCS_ENABLED else None,
+    openapi_url="/openapi.json" if settings.API_DOCS_ENABLED else None,
+    parser=JSONParser(),
+    renderer=ORJSONRenderer(),
 )
 
 
@@ -44,15 +44,14 @@ def update_current_user(request: HttpRequest, data: UserProfileUpdateRequest):
 def delete_current_user(request: HttpRequest):
     user: User = request.auth
     TokenService.revoke_all_for_user(user)
-    user.is_active = False
-    user.save(update_fields=["is_active", "updated_at"])
+    UserService.deactivate_user(user)
     return {"message": "Account deactivated"}
 
 
 @router.get("/context", response=UserContextResponse)
 def get_user_context(request: HttpRequest):
     user: User = request.auth
-    context = getattr(request, "tenant_context", None)
+    context = request.tenant_context
 
     return UserContextResponse(
         id=user.id,
@@ -60,8 +59,8 @@ def get_user_context(request: HttpRequest):
         display_name=user.display_name,
         picture=_build_picture_url(user),
         is_authenticated=True,
-        permissions=context.permissions if context else [],
-        role=context.role if context else "member",
+        permissions=context.permissions,
+        role=context.role,
     )
 
 
@@ -87,7 +86,7 @@ def set_password(request: HttpRequest, data: SetPasswordRequest):
     user: User = request.auth
     if data.new_password != data.confirm_password:
         raise ValidationError("Passwords do not match")
-    auth_method = getattr(request, "token_claims", {}).get("am")
+    auth_method = request.token_claims.get("am")
     UserService.set_password(user, data.new_password, data.current_password, auth_method=auth_method)
     return {"message": "Password updated successfully"}
 
@@ -104,7 +103,7 @@ def list_sessions(request: HttpRequest):
     user: User = request.auth
 
     # Get token_family from the access token claims (set by JWTBearer auth)
-    current_family = getattr(request, "_token_family", None)
+    current_family = request._token_family
 
     sessions = TokenService.get_active_sessions(user)
     return [
@@ -1,22 +1,17 @@
 from datetime import datetime
-from typing import Optional
 from uuid import UUID
 
-import os
-
-from django.conf import settings
 from ninja import Schema
 
 from apps.users.models import User
 from apps.users.services import UserService
+from core.utils.media import build_media_url
 
 
 def _build_picture_url(user: User) -> str:
     if not user.picture:
         return ""
-    base = os.environ.get("DJANGO_BASE_URL", "http://localhost:8000")
-    cache_bust = int(user.updated_at.timestamp()) if user.updated_at else ""
-    return f"{base}{settings.MEDIA_URL}{user.picture.name}?v={cache_bust}"
+    return build_media_url(user.picture.name, user.updated_at)
 
 
 class UserProfileResponse(Schema):
@@ -30,7 +25,7 @@ class UserProfileResponse(Schema):
     has_password: bool
     timezone: str
     created_at: datetime
-    last_login_at: Optional[datetime] = None
+    last_login_at: datetime | None = None
 
     @staticmethod
     def from_user(user: User) -> "UserProfileResponse":
@@ -50,15 +45,15 @@ class UserProfileResponse(Schema):
 
 
 class UserProfileUpdateRequest(Schema):
-    first_name: Optional[str] = None
-    last_name: Optional[str] = None
-    timezone: Optional[str] = None
+    first_name: str | None = None
+    last_name: str | None = None
+    timezone: str | None = None
 
 
 class SetPasswordRequest(Schema):
     new_password: str
     confirm_password: str
-    current_password: Optional[str] = None
+    current_password: str | None = None
 
 
 class PictureResponse(Schema):
@@ -79,7 +74,7 @@ class UserContextResponse(Schema):
 class SessionResponse(Schema):
     id: UUID
     device_info: str
-    ip_address: Optional[str] = None
+    ip_address: str | None = None
     location: str = ""
     last_used_at: datetime
     created_at: datetime
@@ -17,6 +17,7 @@ class RefreshTokenAdmin(admin.ModelAdmin):
     ]
     list_filter = ["is_revoked", "created_at"]
     search_fields = ["user__email", "device_info", "ip_address"]
+    list_select_related = ["user"]
     readonly_fields = ["id", "token_hash", "token_family", "created_at", "last_used_at"]
     raw_id_fields = ["user"]
 
@@ -49,5 +50,6 @@ class ApiKeyAdmin(admin.ModelAdmin):
     ]
     list_filter = ["is_revoked", "created_at"]
     search_fields = ["app__name", "app__owner__email", "name", "prefix"]
+    list_select_related = ["app"]
     readonly_fields = ["id", "key_hash", "prefix", "created_at"]
     raw_id_fields = ["app"]
@@ -2,6 +2,7 @@ import uuid
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 from .managers import RefreshTokenManager, MagicLinkTokenManager, ApiKeyManager
 
@@ -34,7 +35,6 @@ class RefreshToken(models.Model):
 
     @property
     def is_expired(self):
-        from django.utils import timezone
         return self.expires_at <= timezone.now()
 
     @property
@@ -62,7 +62,6 @@ class MagicLinkToken(models.Model):
 
     @property
     def is_expired(self):
-        from django.utils import timezone
         return self.expires_at <= timezone.now()
 
     @property
@@ -90,6 +89,14 @@ class ApiKey(models.Model):
     class Meta:
         db_table = "auth_api_keys"
         ordering = ["-created_at"]
+        indexes = [
+            # Active keys per app: key listing, limit checks and bulk revocation.
+            models.Index(
+                fields=["app"],
+                condition=models.Q(is_revoked=False),
+                name="apikey_active_app_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"ApiKey({self.prefix}..., app={self.app_id})"
@@ -98,7 +105,6 @@ class ApiKey(models.Model):
     def is_expired(self):
         if self.expires_at is None:
             return False
-        from django.utils import timezone
         return self.expires_at <= timezone.now()
 
     @property
@@ -4,12 +4,15 @@ import secrets
 from datetime import timedelta
 
 from django.conf import settings
+from django.contrib.auth.hashers import make_password
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.db import transaction
 from django.utils import timezone
 
 from apps.users.models import User
+from apps.users.services import UserService
+from core.auth.authentication import invalidate_cached_api_keys
 from core.auth.jwt import create_access_token as _encode_jwt
 from core.exceptions.base import (
     AuthenticationError,
@@ -29,6 +32,11 @@ REFRESH_TOKEN_SESSION_LIFETIME = timedelta(hours=24)
 MAGIC_LINK_LIFETIME = timedelta(minutes=15)
 MAGIC_LINK_RATE_LIMIT = 3  # per minute per email
 
+# Session locations are resolved lazily when sessions are listed.
+MAX_LOCATION_LOOKUPS = 3  # per listing
+LOCATION_LOOKUP_TIMEOUT = 1.0  # seconds
+UNKNOWN_LOCATION = "Unknown"
+
 
 def _hash_token(raw_token: str) -> str:
     return hashlib.sha256(raw_token.encode()).hexdigest()
@@ -75,16 +83,14 @@ class TokenService:
         elif ip_address:
             existing.filter(ip_address=ip_address).update(is_revoked=True)
 
-        location = resolve_location(ip_address)
-
         token_obj = RefreshToken.objects.create(
             user=user,
             token_hash=_hash_token(raw_token),
             expires_at=timezone.now() + lifetime,
             device_info=normalized_device,
             ip_address=ip_address,
-            location=location,
         )
+
         return raw_token, str(token_obj.token_family)
 
     @staticmethod
@@ -105,8 +111,9 @@ class TokenService:
                 is_revoked=True
             )
             logger.warning(
-                f"Refresh token reuse detected for user {token_obj.user_id}, "
-                f"family {token_obj.token_family}"
+                "Refresh token reuse detected for user %s, family %s",
+                token_obj.user_id,
+                token_obj.token_family,
             )
             raise TokenInvalidError("Refresh token reuse detected")
 
@@ -167,6 +174,10 @@ class TokenService:
         # This keeps the UI clean even if historical active rows exist.
         rows = (
             RefreshToken.objects.for_user(user)
+            .only(
+                "id", "token_family", "device_info", "ip_address", "location",
+                "last_used_at", "created_at",
+            )
             .order_by("-last_used_at")
         )
         seen_fingerprints: set[str] = set()
@@ -177,8 +188,31 @@ class TokenService:
                 continue
             seen_fingerprints.add(fingerprint)
             result.append(row)
+        TokenService._fill_locations(result)
         return result
 
+    @staticmethod
+    def _fill_locations(sessions: list[RefreshToken]) -> None:
+        # GeoIP is a network call, so it is not done at login. Sessions are
+        # resolved when they are listed, a few addresses per listing with a
+        # short timeout, and the result (or UNKNOWN_LOCATION when the lookup
+        # fails) is stored for the whole token family so it is not retried.
+        pending: dict[str, list[RefreshToken]] = {}
+        for row in sessions:
+            if not row.location and row.ip_address:
+                pending.setdefault(row.ip_address, []).append(row)
+        for ip_address in list(pending)[:MAX_LOCATION_LOOKUPS]:
+            rows = pending[ip_address]
+            location = (
+                resolve_location(ip_address, timeout=LOCATION_LOOKUP_TIMEOUT)
+                or UNKNOWN_LOCATION
+            )
+            for row in rows:
+                row.location = location
+            RefreshToken.objects.filter(
+                token_family__in=[row.token_family for row in rows], location=""
+            ).update(location=location)
+
     @staticmethod
     def cleanup_expired() -> int:
         count, _ = RefreshToken.objects.cleanup_expired()
@@ -192,8 +226,6 @@ class MagicLinkService:
     def create_and_send(
         email: str, ip_address: str | None = None, flow: str | None = None,
     ) -> None:
-        email = email.lower().strip()
-
         # Rate limiting: max 3 per minute per email
         one_minute_ago = timezone.now() - timedelta(minutes=1)
         recent_count = MagicLinkToken.objects.filter(
@@ -204,7 +236,7 @@ class MagicLinkService:
 
         raw_token = secrets.token_urlsafe(48)
 
-        MagicLinkToken.objects.create(
+        token = MagicLinkToken.objects.create(
             email=email,
             token_hash=_hash_token(raw_token),
             expires_at=timezone.now() + MAGIC_LINK_LIFETIME,
@@ -216,6 +248,27 @@ class MagicLinkService:
         if flow:
             verify_url += f"&flow={flow}"
 
+        # SMTP can take seconds; send after commit so the transaction (and its
+        # row locks) is not held open for the round-trip. This stays on the
+        # request thread: on serverless deployments work left running after the
+        # response is not guaranteed to finish, and this email must go out.
+        transaction.on_commit(
+            lambda: MagicLinkService._send_or_discard(token.pk, email, verify_url)
+        )
+
+    @staticmethod
+    def _send_or_discard(token_id, email: str, verify_url: str) -> None:
+        # The token is already committed: if the email never went out, drop it
+        # so it does not count against the sender's rate limit.
+        try:
+            MagicLinkService._send_email(email, verify_url)
+        except Exception:
+            logger.exception("Failed to send magic link to %s", email)
+            MagicLinkToken.objects.filter(pk=token_id).delete()
+            raise
+
+    @staticmethod
+    def _send_email(email: str, verify_url: str) -> None:
         from_email = getattr(settings, "DEFAULT_FROM_EMAIL", "noreply@apilens.ai")
         context = {"verify_url": verify_url}
         plain_text = render_to_string("auth/emails/magic_link.txt", context)
@@ -230,7 +283,7 @@ class MagicLinkService:
         msg.attach_alternative(html_content, "text/html")
         msg.send(fail_silently=False)
 
-        logger.info(f"Magic link sent to {email}")
+        logger.info("Magic link sent to %s", email)
 
     @staticmethod
     @transaction.atomic
@@ -248,8 +301,13 @@ class MagicLinkService:
         if token_obj.is_expired:
             raise TokenExpiredError("Magic link has expired")
 
-        token_obj.is_used = True
-        token_obj.save(update_fields=["is_used"])
+        # Claim the token atomically: of two concurrent verifications only one
+        # can flip is_used, the other sees zero rows updated.
+        claimed = MagicLinkToken.objects.filter(
+            pk=token_obj.pk, is_used=False
+        ).update(is_used=True)
+        if not claimed:
+            raise TokenInvalidError("Magic link has already been used")
 
         return token_obj.email
 
@@ -269,26 +327,28 @@ class AuthService:
     ) -> tuple[str, str, User]:
         email = MagicLinkService.verify(raw_token)
 
+        now = timezone.now()
+        # New users are inserted fully populated; existing users get a single
+        # UPDATE covering every field that changed on this login.
         user, created = User.objects.get_or_create(
             email=email,
             defaults={
                 "email_verified": True,
                 "auth_provider": "magic_link",
                 "is_active": True,
+                "password": make_password(None),
+                "last_login_at": now,
             },
         )
 
-        if not user.email_verified:
-            user.email_verified = True
-            user.save(update_fields=["email_verified", "updated_at"])
-
         if created:
-            user.set_unusable_password()
-            user.save(update_fields=["password"])
-            logger.info(f"New user created via magic link: {email}")
-
-        user.last_login_at = timezone.now()
-        user.save(update_fields=["last_login_at", "updated_at"])
+            logger.info("New user created via magic link: %s", email)
+        elif not user.email_verified:
+            user.email_verified = True
+            user.last_login_at = now
+            user.save(update_fields=["email_verified", "last_login_at", "updated_at"])
+        else:
+            UserService.update_last_login(user)
 
         refresh_token, token_family = TokenService.create_refresh_token(
             user, device_info, ip_address, remember_me
@@ -305,18 +365,18 @@ class AuthService:
         email: str, password: str, device_info: str = "",
         ip_address: str | None = None, remember_me: bool = True,
     ) -> tuple[str, str, User]:
-        email = email.lower().strip()
-
         try:
-            user = User.objects.get(email=email, is_active=True)
+            # Only the columns needed to verify the password and mint tokens.
+            user = User.objects.only("id", "email", "password").get(
+                email=email, is_active=True,
+            )
         except User.DoesNotExist:
             raise AuthenticationError("Invalid email or password")
 
         if not user.has_usable_password() or not user.check_password(password):
             raise AuthenticationError("Invalid email or password")
 
-        user.last_login_at = timezone.now()
-        user.save(update_fields=["last_login_at", "updated_at"])
+        UserService.update_last_login(user)
 
         refresh_token, token_family = TokenService.create_refresh_token(
             user, device_info, ip_address, remember_me,
@@ -345,10 +405,13 @@ MAX_API_KEYS_PER_APP = 10
 
 
 class ApiKeyService:
+    @staticmethod
+    def count_active(app) -> int:
+        return ApiKey.objects.for_app(app).count()
+
     @staticmethod
     def create_key(app, name: str) -> tuple[str, ApiKey]:
-        active_count = ApiKey.objects.for_app(app).count()
-        if active_count >= MAX_API_KEYS_PER_APP:
+        if ApiKeyService.count_active(app) >= MAX_API_KEYS_PER_APP:
             raise RateLimitError(
                 f"Maximum of {MAX_API_KEYS_PER_APP} active API keys allowed per app"
             )
@@ -366,18 +429,39 @@ class ApiKeyService:
         return raw_key, api_key
 
     @staticmethod
-    def list_keys(app) -> list[ApiKey]:
-        return list(ApiKey.objects.for_app(app).order_by("-created_at"))
+    def list_keys(app) -> list[dict]:
+        return list(
+            ApiKey.objects.for_app(app)
+            .order_by("-created_at")
+            .values("id", "name", "prefix", "last_used_at", "created_at")
+        )
 
     @staticmethod
     def revoke_key(app, key_id: str) -> bool:
-        updated = ApiKey.objects.filter(
-            id=key_id, app=app, is_revoked=False
-        ).update(is_revoked=True)
-        return updated > 0
+        return ApiKeyService._revoke(
+            ApiKey.objects.filter(id=key_id, app=app, is_revoked=False)
+        ) > 0
 
     @staticmethod
     def revoke_all_for_app(app) -> int:
-        return ApiKey.objects.filter(
-            app=app, is_revoked=False
+        return ApiKeyService._revoke(
+            ApiKey.objects.filter(app=app, is_revoked=False)
+        )
+
+    @staticmethod
+    def revoke_all_for_app_slug(user, slug: str) -> int:
+        return ApiKeyService._revoke(
+            ApiKey.objects.filter(app__owner=user, app__slug=slug, is_revoked=False)
+        )
+
+    @staticmethod
+    def _revoke(queryset) -> int:
+        # ApiKeyAuth caches resolved keys, so drop them once the revoke commits.
+        key_hashes = list(queryset.values_list("key_hash", flat=True))
+        if not key_hashes:
+            return 0
+        updated = ApiKey.objects.filter(
+            key_hash__in=key_hashes, is_revoked=False
         ).update(is_revoked=True)
+        invalidate_cached_api_keys(key_hashes)
+        return updated
@@ -6,6 +6,7 @@ from .models import App, Endpoint, Environment
 @admin.register(App)
 class AppAdmin(admin.ModelAdmin):
     list_display = ("name", "slug", "owner", "is_active", "created_at")
+    list_select_related = ("owner",)
     list_filter = ("is_active",)
     search_fields = ("name", "slug", "owner__email")
     readonly_fields = ("id", "created_at", "updated_at")
@@ -14,6 +15,7 @@ class AppAdmin(admin.ModelAdmin):
 @admin.register(Endpoint)
 class EndpointAdmin(admin.ModelAdmin):
     list_display = ("method", "path", "app", "is_active", "last_seen_at", "created_at")
+    list_select_related = ("app",)
     list_filter = ("method", "is_active")
     search_fields = ("path", "app__name")
     readonly_fields = ("id", "created_at", "updated_at")
@@ -22,6 +24,7 @@ class EndpointAdmin(admin.ModelAdmin):
 @admin.register(Environment)
 class EnvironmentAdmin(admin.ModelAdmin):
     list_display = ("name", "slug", "app", "color", "order", "is_active", "created_at")
+    list_select_related = ("app",)
     list_filter = ("is_active",)
     search_fields = ("name", "slug", "app__name")
     readonly_fields = ("id", "created_at", "updated_at")
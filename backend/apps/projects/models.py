@@ -49,6 +49,14 @@ class App(models.Model):
                 name="unique_app_slug_per_owner",
             ),
         ]
+        indexes = [
+            # Serves AppManager.for_user(...).order_by("-created_at").
+            models.Index(
+                fields=["owner", "-created_at"],
+                condition=models.Q(is_active=True),
+                name="app_active_owner_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.slug})"
@@ -9,11 +9,13 @@ from io import BytesIO
 from django.conf import settings
 from django.core.files.base import ContentFile
 from django.db import IntegrityError, transaction
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.utils import timezone
 from django.utils.text import slugify
 from PIL import Image
 
+from apps.auth.services import ApiKeyService
+from core.database.clickhouse.client import get_clickhouse_client
 from core.exceptions.base import NotFoundError, RateLimitError, ValidationError, ConflictError
 
 from .models import App, Endpoint, Environment
@@ -30,6 +32,8 @@ RESERVED_SLUGS = {
     "system", "internal", "public", "private",
 }
 ALLOWED_IMAGE_TYPES = {"image/jpeg", "image/png", "image/webp"}
+_VALID_FRAMEWORKS = frozenset(App.Framework.values)
+_VALID_METHODS = frozenset(Endpoint.Method.values)
 
 
 def _resolve_time_range(since: str | None, until: str | None) -> tuple[datetime, datetime]:
@@ -52,25 +56,20 @@ def _unique_slug(user, name: str, exclude_id=None) -> str:
     if not base:
         base = "app"
 
+    # Slug is protected by a DB unique constraint on (owner, slug),
+    # so uniqueness must be checked across all rows, not only active ones.
+    # Fetch every slug sharing the prefix once instead of probing per candidate.
+    qs = App.objects.filter(owner=user, slug__startswith=base)
+    if exclude_id:
+        qs = qs.exclude(id=exclude_id)
+    taken = set(qs.values_list("slug", flat=True))
+
     candidate = base
     counter = 1
-
-    while True:
-        if candidate in RESERVED_SLUGS:
-            candidate = f"{base}-{counter}"
-            counter += 1
-            continue
-
-        # Slug is protected by a DB unique constraint on (owner, slug),
-        # so uniqueness must be checked across all rows, not only active ones.
-        qs = App.objects.filter(owner=user, slug=candidate)
-        if exclude_id:
-            qs = qs.exclude(id=exclude_id)
-        if not qs.exists():
-            return candidate
-
+    while candidate in taken or candidate in RESERVED_SLUGS:
         candidate = f"{base}-{counter}"
         counter += 1
+    return candidate
 
 
 class AppService:
@@ -85,10 +84,11 @@ class AppService:
         if not name:
             raise ValidationError("App name is required")
         framework = (framework or "fastapi").strip().lower()
-        if framework not in App.Framework.values:
+        if framework not in _VALID_FRAMEWORKS:
             raise ValidationError("Invalid framework")
 
-        if App.objects.for_user(user).count() >= MAX_APPS_PER_USER:
+        # LIMIT bounds the count: we only need to know whether the cap is hit.
+        if App.objects.for_user(user)[:MAX_APPS_PER_USER].count() >= MAX_APPS_PER_USER:
             raise RateLimitError(f"Maximum of {MAX_APPS_PER_USER} apps allowed")
 
         # Retry for rare concurrent create collisions.
@@ -105,7 +105,7 @@ class AppService:
                     )
                     return app
             except IntegrityError as exc:
-                if "unique_owner_slug" in str(exc):
+                if "unique_app_slug_per_owner" in str(exc):
                     if attempt == 4:
                         raise ConflictError("App name already exists. Try a different name.")
                     continue
@@ -115,7 +115,20 @@ class AppService:
 
     @staticmethod
     def list_apps(user) -> list[App]:
-        return list(App.objects.for_user(user).order_by("-created_at"))
+        return list(
+            App.objects.for_user(user)
+            .only(
+                "id", "name", "slug", "icon_image", "description",
+                "framework", "created_at", "updated_at",
+            )
+            .annotate(
+                api_key_count=Count(
+                    "api_keys",
+                    filter=Q(api_keys__is_revoked=False),
+                )
+            )
+            .order_by("-created_at")
+        )
 
     @staticmethod
     def get_app_by_slug(user, slug: str) -> App:
@@ -134,40 +147,50 @@ class AppService:
         framework: str | None = None,
     ) -> App:
         app = AppService.get_app_by_slug(user, slug)
+        update_fields: list[str] = []
 
         if name is not None:
             name = name.strip()
             if not name:
                 raise ValidationError("App name is required")
-            app.name = name
-            app.slug = _unique_slug(user, name, exclude_id=app.id)
+            if name != app.name:
+                app.name = name
+                app.slug = _unique_slug(user, name, exclude_id=app.id)
+                update_fields += ["name", "slug"]
 
         if description is not None:
-            app.description = description.strip()
+            description = description.strip()
+            if description != app.description:
+                app.description = description
+                update_fields.append("description")
 
         if framework is not None:
             normalized = framework.strip().lower()
-            if normalized not in App.Framework.values:
+            if normalized not in _VALID_FRAMEWORKS:
                 raise ValidationError("Invalid framework")
-            app.framework = normalized
+            if normalized != app.framework:
+                app.framework = normalized
+                update_fields.append("framework")
 
-        app.save()
+        if update_fields:
+            app.save(update_fields=update_fields + ["updated_at"])
         return app
 
     @staticmethod
     @transaction.atomic
     def delete_app(user, slug: str) -> None:
-        app = AppService.get_app_by_slug(user, slug)
+        # Soft-delete without loading the row first: one UPDATE for the app,
+        # one for its keys.
+        deleted = App.objects.filter(owner=user, slug=slug, is_active=True).update(
+            is_active=False, updated_at=timezone.now(),
+        )
+        if not deleted:
+            raise NotFoundError("App not found")
 
         # Revoke all API keys for this app
-        from apps.auth.services import ApiKeyService
-        ApiKeyService.revoke_all_for_app(app)
-
-        app.is_active = False
-        app.save(update_fields=["is_active", "updated_at"])
+        ApiKeyService.revoke_all_for_app_slug(user, slug)
 
     @staticmethod
-    @transaction.atomic
     def update_icon(app: App, file) -> App:
         if file.content_type not in ALLOWED_IMAGE_TYPES:
             raise ValidationError("Only JPEG, PNG, and WebP images are allowed")
@@ -235,18 +258,22 @@ class EndpointService:
             raise ValidationError("Endpoint path is required")
 
         method = method.upper()
-        if method not in Endpoint.Method.values:
+        if method not in _VALID_METHODS:
             raise ValidationError(f"Invalid method: {method}")
 
-        if Endpoint.objects.filter(app=app, path=path, method=method, is_active=True).exists():
-            raise ConflictError(f"{method} {path} already exists")
-
-        return Endpoint.objects.create(
-            app=app,
-            path=path,
-            method=method,
-            description=description.strip(),
-        )
+        # unique_endpoint_per_app guards duplicates; let the INSERT detect them.
+        try:
+            with transaction.atomic():
+                return Endpoint.objects.create(
+                    app=app,
+                    path=path,
+                    method=method,
+                    description=description.strip(),
+                )
+        except IntegrityError as exc:
+            if "unique_endpoint_per_app" in str(exc):
+                raise ConflictError(f"{method} {path} already exists")
+            raise
 
     @staticmethod
     def list_endpoints(app) -> list[Endpoint]:
@@ -266,23 +293,32 @@ class EndpointService:
         method: str | None = None, description: str | None = None,
     ) -> Endpoint:
         endpoint = EndpointService.get_endpoint(app, endpoint_id)
+        update_fields: list[str] = []
 
         if path is not None:
             path = path.strip()
             if not path:
                 raise ValidationError("Endpoint path is required")
-            endpoint.path = path
+            if path != endpoint.path:
+                endpoint.path = path
+                update_fields.append("path")
 
         if method is not None:
             method = method.upper()
-            if method not in Endpoint.Method.values:
+            if method not in _VALID_METHODS:
                 raise ValidationError(f"Invalid method: {method}")
-            endpoint.method = method
+            if method != endpoint.method:
+                endpoint.method = method
+                update_fields.append("method")
 
         if description is not None:
-            endpoint.description = description.strip()
+            description = description.strip()
+            if description != endpoint.description:
+                endpoint.description = description
+                update_fields.append("description")
 
-        endpoint.save()
+        if update_fields:
+            endpoint.save(update_fields=update_fields + ["updated_at"])
         return endpoint
 
     @staticmethod
@@ -305,10 +341,9 @@ DEFAULT_ENVIRONMENTS = [
 class EnvironmentService:
     @staticmethod
     def create_default_environments(app) -> list[Environment]:
-        envs = []
-        for env_data in DEFAULT_ENVIRONMENTS:
-            envs.append(Environment.objects.create(app=app, **env_data))
-        return envs
+        return Environment.objects.bulk_create(
+            [Environment(app=app, **env_data) for env_data in DEFAULT_ENVIRONMENTS]
+        )
 
     @staticmethod
     @transaction.atomic
@@ -317,19 +352,25 @@ class EnvironmentService:
         if not name:
             raise ValidationError("Environment name is required")
 
-        if Environment.objects.for_app(app).count() >= MAX_ENVIRONMENTS_PER_APP:
-            raise RateLimitError(f"Maximum of {MAX_ENVIRONMENTS_PER_APP} environments per app")
-
         slug = slugify(name)
         if not slug:
             slug = "env"
 
-        if Environment.objects.filter(app=app, slug=slug).exists():
+        # One aggregate instead of separate limit, slug and ordering queries.
+        stats = Environment.objects.filter(app=app).aggregate(
+            total=Count("id"),
+            active=Count("id", filter=Q(is_active=True)),
+            slug_taken=Count("id", filter=Q(slug=slug)),
+        )
+
+        if stats["active"] >= MAX_ENVIRONMENTS_PER_APP:
+            raise RateLimitError(f"Maximum of {MAX_ENVIRONMENTS_PER_APP} environments per app")
+
+        if stats["slug_taken"]:
             raise ConflictError(f"Environment '{name}' already exists")
 
-        order = Environment.objects.filter(app=app).count()
         return Environment.objects.create(
-            app=app, name=name, slug=slug, color=color, order=order,
+            app=app, name=name, slug=slug, color=color, order=stats["total"],
         )
 
     @staticmethod
@@ -354,16 +395,19 @@ class EnvironmentService:
             name = name.strip()
             if not name:
                 raise ValidationError("Environment name is required")
-            new_slug = slugify(name)
-            if new_slug != env.slug and Environment.objects.filter(app=app, slug=new_slug).exists():
-                raise ConflictError(f"Environment '{name}' already exists")
             env.name = name
-            env.slug = new_slug
+            env.slug = slugify(name)
 
         if color is not None:
             env.color = color
 
-        env.save()
+        # unique_environment_slug_per_app rejects a clashing rename; no need to
+        # probe for it first.
+        try:
+            with transaction.atomic():
+                env.save()
+        except IntegrityError:
+            raise ConflictError(f"Environment '{name}' already exists")
         return env
 
     @staticmethod
@@ -525,13 +569,10 @@ class IngestService:
         if not records:
             return 0
 
-        from core.database.clickhouse.client import get_clickhouse_client
         client = get_clickhouse_client()
         IngestService.ensure_payload_columns(client)
         IngestService.ensure_consumer_columns(client)
 
-        method_choices = set(Endpoint.Method.values)
-
         # Track latest seen timestamp per (method, path) for endpoint auto-discovery.
         endpoint_last_seen: dict[tuple[str, str], datetime] = {}
         normalized_records: list[dict] = []
@@ -561,7 +602,7 @@ class IngestService:
             )
 
             # Endpoint model supports these methods only; unsupported methods still ingest.
-            if method not in method_choices:
+            if method not in _VALID_METHODS:
                 continue
             key = (method, path)
             prev = endpoint_last_seen.get(key)
@@ -596,14 +637,15 @@ class IngestService:
             ]
             if missing:
                 Endpoint.objects.bulk_create(missing, ignore_conflicts=True)
-                refreshed = list(
-                    Endpoint.objects.filter(
-                        app_id=app_id,
-                        method__in=methods,
-                        path__in=paths,
-                    )
+                # ignore_conflicts leaves pks unset; re-read only the rows just
+                # inserted (or concurrently created) rather than the whole batch.
+                refreshed = Endpoint.objects.filter(
+                    app_id=app_id,
+                    method__in={ep.method for ep in missing},
+                    path__in={ep.path for ep in missing},
                 )
-                endpoint_map = {(ep.method, ep.path): ep for ep in refreshed}
+                for ep in refreshed:
+                    endpoint_map.setdefault((ep.method, ep.path), ep)
 
             to_update: list[Endpoint] = []
             now = timezone.now()
@@ -662,7 +704,6 @@ class IngestService:
         if not records:
             return 0
 
-        from core.database.clickhouse.client import get_clickhouse_client
 
         client = get_clickhouse_client()
         IngestService.ensure_api_logs_table(client)
@@ -732,7 +773,6 @@ class EndpointStatsService:
         status_class: str | None = None,
         status_code: int | None = None,
     ) -> dict:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         safe_page = max(1, int(page))
         safe_size = max(1, min(int(page_size), 200))
@@ -1017,7 +1057,6 @@ class EndpointStatsService:
         until: str | None = None,
         limit: int = 50,
     ) -> list[dict]:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         try:
             client = get_clickhouse_client()
@@ -1061,7 +1100,6 @@ class ConsumerStatsService:
         until: str | None = None,
         limit: int = 20,
     ) -> list[dict]:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         try:
             client = get_clickhouse_client()
@@ -1127,7 +1165,6 @@ class ConsumerStatsService:
         until: str | None = None,
         limit: int = 100,
     ) -> list[dict]:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         if not consumer or not consumer.strip():
             return []
@@ -1143,7 +1180,6 @@ class ConsumerStatsService:
         path: str | None = None,
         limit: int = 100,
     ) -> list[dict]:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         if not consumer or not consumer.strip():
             return []
@@ -1358,7 +1394,6 @@ class LogsService:
         page: int = 1,
         page_size: int = 50,
     ) -> dict:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         safe_page = max(1, int(page))
         safe_size = max(1, min(int(page_size), 200))
@@ -1463,7 +1498,6 @@ class LogsService:
         attribute_filters: list[tuple[str, str]] | None = None,
         logger_filters: list[str] | None = None,
     ) -> dict:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         try:
             client = get_clickhouse_client()
@@ -1531,7 +1565,6 @@ class LogsService:
         logger_filters: list[str] | None = None,
         bucket_minutes: int = 5,
     ) -> list[dict]:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         allowed_buckets = {5, 10, 15, 30, 60, 120, 180, 240, 360, 720, 1440}
         safe_bucket = int(bucket_minutes) if int(bucket_minutes) in allowed_buckets else 5
@@ -1593,7 +1626,6 @@ class LogsService:
         prefix: str | None = None,
         limit: int = 12,
     ) -> dict:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         safe_limit = max(1, min(int(limit), 50))
         normalized_prefix = (prefix or "").strip().lower()
@@ -1721,7 +1753,6 @@ class AnalyticsService:
         since: str | None = None,
         until: str | None = None,
     ) -> dict:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         try:
             client = get_clickhouse_client()
@@ -1808,7 +1839,6 @@ class AnalyticsService:
         since: str | None = None,
         until: str | None = None,
     ) -> list[dict]:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         try:
             client = get_clickhouse_client()
@@ -1855,7 +1885,6 @@ class AnalyticsService:
         until: str | None = None,
         limit: int = 20,
     ) -> list[dict]:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         try:
             client = get_clickhouse_client()
@@ -1911,7 +1940,6 @@ class AnalyticsService:
         since: str | None = None,
         until: str | None = None,
     ) -> dict:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         try:
             client = get_clickhouse_client()
@@ -1994,7 +2022,6 @@ class AnalyticsService:
         since: str | None = None,
         until: str | None = None,
     ) -> list[dict]:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         try:
             client = get_clickhouse_client()
@@ -2047,7 +2074,6 @@ class AnalyticsService:
         until: str | None = None,
         limit: int = 10,
     ) -> list[dict]:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         try:
             client = get_clickhouse_client()
@@ -2112,7 +2138,6 @@ class AnalyticsService:
         until: str | None = None,
         limit: int = 20,
     ) -> list[dict]:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         try:
             client = get_clickhouse_client()
@@ -2165,7 +2190,6 @@ class AnalyticsService:
         until: str | None = None,
         limit: int = 20,
     ) -> list[dict]:
-        from core.database.clickhouse.client import get_clickhouse_client
 
         try:
             client = get_clickhouse_client()
@@ -0,0 +1,19 @@
+from django.apps import AppConfig
+
+
+class UsersConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.users"
+    label = "users"
+
+    def ready(self) -> None:
+        from django.db.models.signals import post_delete, post_save
+
+        from .models import User
+        from .services import invalidate_cached_user
+
+        def _invalidate(sender, instance, **kwargs):
+            invalidate_cached_user(instance.pk)
+
+        post_save.connect(_invalidate, sender=User, weak=False, dispatch_uid="users.invalidate_cache.save")
+        post_delete.connect(_invalidate, sender=User, weak=False, dispatch_uid="users.invalidate_cache.delete")
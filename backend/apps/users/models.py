@@ -51,7 +51,8 @@ class User(AbstractUser):
         return self.email
 
     def save(self, *args, **kwargs):
-        if not self.username:
+        # username is only derived once, on INSERT; updates skip the check.
+        if self._state.adding and not self.username:
             self.username = str(self.id)[:150]
         super().save(*args, **kwargs)
 
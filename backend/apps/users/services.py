@@ -5,6 +5,7 @@ from typing import Optional
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.base import ContentFile
 from django.db import transaction
 from django.utils import timezone
@@ -20,8 +21,34 @@ logger = logging.getLogger(__name__)
 
 ALLOWED_IMAGE_TYPES = {"image/jpeg", "image/png", "image/webp"}
 
+# Authenticated requests resolve the user from the access token on every
+# call; keep active users cached briefly instead of hitting Postgres each time.
+# Only used with a shared cache (settings.AUTH_CACHE_ENABLED).
+USER_CACHE_TTL_SECONDS = 60
+
+
+def _user_cache_key(user_id) -> str:
+    return f"auth_user:{user_id}"
+
+
+def invalidate_cached_user(user_id) -> None:
+    # Defer until commit so a concurrent request cannot re-cache the old row.
+    transaction.on_commit(lambda: cache.delete(_user_cache_key(user_id)))
+
 
 class UserService:
+    @staticmethod
+    def get_active_user(user_id) -> Optional[User]:
+        if not settings.AUTH_CACHE_ENABLED:
+            return User.objects.filter(id=user_id, is_active=True).first()
+        key = _user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = User.objects.filter(id=user_id, is_active=True).first()
+            if user is not None:
+                cache.set(key, user, USER_CACHE_TTL_SECONDS)
+        return user
+
     @staticmethod
     def get_timezone(user: User) -> str:
         value = user.metadata.get("timezone") if isinstance(user.metadata, dict) else None
@@ -55,20 +82,22 @@ class UserService:
         )
 
     @staticmethod
-    @transaction.atomic
     def update_profile(
         user: User,
         first_name: str | None = None,
         last_name: str | None = None,
         timezone_name: str | None = None,
     ) -> User:
+        # The request user may be a cached copy; compare against the stored row
+        # so a stale value can neither skip a real change nor clobber metadata.
+        user.refresh_from_db(fields=["first_name", "last_name", "metadata"])
         update_fields = []
 
-        if first_name is not None:
+        if first_name is not None and user.first_name != first_name[:150]:
             user.first_name = first_name[:150]
             update_fields.append("first_name")
 
-        if last_name is not None:
+        if last_name is not None and user.last_name != last_name[:150]:
             user.last_name = last_name[:150]
             update_fields.append("last_name")
 
@@ -86,15 +115,24 @@ class UserService:
         return user
 
     @staticmethod
-    @transaction.atomic
     def deactivate_user(user: User) -> None:
+        # A plain UPDATE skips save() and its signals, so drop the cached
+        # user explicitly.
+        now = timezone.now()
+        User.objects.filter(pk=user.pk).update(is_active=False, updated_at=now)
         user.is_active = False
-        user.save(update_fields=["is_active", "updated_at"])
+        user.updated_at = now
+        invalidate_cached_user(user.pk)
 
     @staticmethod
     def update_last_login(user: User) -> None:
-        user.last_login_at = timezone.now()
-        user.save(update_fields=["last_login_at", "updated_at"])
+        # Logging in is not a profile change: leave updated_at (which also
+        # cache-busts the picture URL) alone and write the one column.
+        now = timezone.now()
+        User.objects.filter(pk=user.pk).update(last_login_at=now)
+        user.last_login_at = now
+        # .update() skips the post_save invalidation.
+        invalidate_cached_user(user.pk)
 
     @staticmethod
     def get_by_email(email: str) -> Optional[User]:
@@ -104,7 +142,6 @@ class UserService:
             return None
 
     @staticmethod
-    @transaction.atomic
     def set_password(
         user: User, new_password: str, current_password: str | None = None,
         auth_method: str | None = None,
@@ -127,7 +164,6 @@ class UserService:
         return user
 
     @staticmethod
-    @transaction.atomic
     def update_picture(user: User, file) -> User:
         if file.content_type not in ALLOWED_IMAGE_TYPES:
             raise ValidationError("Only JPEG, PNG, and WebP images are allowed")
@@ -10,18 +10,23 @@ from dotenv import load_dotenv
 BASE_DIR = Path(__file__).resolve().parent.parent
 load_dotenv()
 
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.environ.get(name, default).strip().lower() in ("true", "1", "yes")
+
+
+def _env_list(name: str, default: str) -> list[str]:
+    return [item.strip() for item in os.environ.get(name, default).split(",") if item.strip()]
+
+
 SECRET_KEY = os.environ.get(
     "DJANGO_SECRET_KEY",
     "django-insecure-change-me-in-production"
 )
 
-DEBUG = os.environ.get("DJANGO_DEBUG", "False").lower() in ("true", "1", "yes")
+DEBUG = _env_bool("DJANGO_DEBUG", "False")
 
-ALLOWED_HOSTS = [
-    host.strip()
-    for host in os.environ.get("DJANGO_ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
-    if host.strip()
-]
+ALLOWED_HOSTS = _env_list("DJANGO_ALLOWED_HOSTS", "localhost,127.0.0.1")
 # Allow ngrok domains for development only
 if DEBUG:
     ALLOWED_HOSTS += [".ngrok-free.app", ".ngrok.io"]
@@ -62,10 +67,10 @@ MIDDLEWARE = [
 
 # Security hardening (safe defaults for production)
 if not DEBUG:
-    SECURE_SSL_REDIRECT = os.environ.get("DJANGO_SECURE_SSL_REDIRECT", "True").lower() in ("true", "1", "yes")
+    SECURE_SSL_REDIRECT = _env_bool("DJANGO_SECURE_SSL_REDIRECT", "True")
     SECURE_HSTS_SECONDS = int(os.environ.get("DJANGO_SECURE_HSTS_SECONDS", "31536000"))
-    SECURE_HSTS_INCLUDE_SUBDOMAINS = os.environ.get("DJANGO_SECURE_HSTS_INCLUDE_SUBDOMAINS", "True").lower() in ("true", "1", "yes")
-    SECURE_HSTS_PRELOAD = os.environ.get("DJANGO_SECURE_HSTS_PRELOAD", "True").lower() in ("true", "1", "yes")
+    SECURE_HSTS_INCLUDE_SUBDOMAINS = _env_bool("DJANGO_SECURE_HSTS_INCLUDE_SUBDOMAINS", "True")
+    SECURE_HSTS_PRELOAD = _env_bool("DJANGO_SECURE_HSTS_PRELOAD", "True")
     SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 else:
     SECURE_SSL_REDIRECT = False
@@ -84,14 +89,10 @@ SECURE_REFERRER_POLICY = "same-origin"
 X_FRAME_OPTIONS = "DENY"
 
 # CORS Configuration
-CORS_ALLOWED_ORIGINS = [
-    origin.strip()
-    for origin in os.environ.get(
-        "CORS_ALLOWED_ORIGINS",
-        "http://localhost:3000,http://127.0.0.1:3000"
-    ).split(",")
-    if origin.strip()
-]
+CORS_ALLOWED_ORIGINS = _env_list(
+    "CORS_ALLOWED_ORIGINS",
+    "http://localhost:3000,http://127.0.0.1:3000",
+)
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOW_HEADERS = [
     "accept",
@@ -149,6 +150,7 @@ if database_url:
             "HOST": parsed.hostname or "localhost",
             "PORT": str(parsed.port or "5432"),
             "CONN_MAX_AGE": 60,
+            "CONN_HEALTH_CHECKS": True,
             "OPTIONS": db_options,
         }
     }
@@ -193,12 +195,29 @@ else:
             "HOST": db_host,
             "PORT": db_port,
             "CONN_MAX_AGE": 60,
+            "CONN_HEALTH_CHECKS": True,
             "OPTIONS": {
                 "connect_timeout": 10,
             },
         }
     }
 
+# Shared cache (Redis). Users and API keys are only cached across requests when
+# one is configured: a per-process LocMem cache cannot be invalidated from other
+# workers or serverless instances, so revocations would lag behind.
+redis_url = os.environ.get("APILENS_REDIS_URL", "").strip()
+if redis_url:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": redis_url,
+        }
+    }
+AUTH_CACHE_ENABLED = bool(redis_url)
+
+# Interactive API docs and the OpenAPI schema (set to False to skip exposing them)
+API_DOCS_ENABLED = _env_bool("DJANGO_API_DOCS_ENABLED", "True")
+
 # Frontend URL (for magic link emails)
 FRONTEND_URL = os.environ.get("FRONTEND_URL", "http://localhost:3000")
 
@@ -211,7 +230,7 @@ EMAIL_HOST = os.environ.get("EMAIL_HOST", "")
 EMAIL_PORT = int(os.environ.get("EMAIL_PORT", "587"))
 EMAIL_HOST_USER = os.environ.get("EMAIL_HOST_USER", "")
 EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD", "")
-EMAIL_USE_TLS = os.environ.get("EMAIL_USE_TLS", "True").lower() in ("true", "1", "yes")
+EMAIL_USE_TLS = _env_bool("EMAIL_USE_TLS", "True")
 
 # ClickHouse Configuration (analytics/event store)
 clickhouse_url = os.environ.get("APILENS_CLICKHOUSE_URL", "").strip() or os.environ.get("CLICKHOUSE_URL", "").strip()
@@ -226,7 +245,7 @@ if clickhouse_url:
         "USER": unquote(ch_parsed.username or "default"),
         "PASSWORD": unquote(ch_parsed.password or ""),
         "SECURE": ch_secure,
-        "VERIFY": os.environ.get("APILENS_CLICKHOUSE_VERIFY", "True").lower() in ("true", "1", "yes"),
+        "VERIFY": _env_bool("APILENS_CLICKHOUSE_VERIFY", "True"),
     }
 else:
     CLICKHOUSE = {
@@ -235,8 +254,8 @@ else:
         "DATABASE": os.environ.get("APILENS_CLICKHOUSE_DATABASE", os.environ.get("CLICKHOUSE_DATABASE", "apilens")),
         "USER": os.environ.get("APILENS_CLICKHOUSE_USER", os.environ.get("CLICKHOUSE_USER", "default")),
         "PASSWORD": os.environ.get("APILENS_CLICKHOUSE_PASSWORD", os.environ.get("CLICKHOUSE_PASSWORD", "")),
-        "SECURE": os.environ.get("APILENS_CLICKHOUSE_SECURE", "False").lower() in ("true", "1", "yes"),
-        "VERIFY": os.environ.get("APILENS_CLICKHOUSE_VERIFY", "True").lower() in ("true", "1", "yes"),
+        "SECURE": _env_bool("APILENS_CLICKHOUSE_SECURE", "False"),
+        "VERIFY": _env_bool("APILENS_CLICKHOUSE_VERIFY", "True"),
     }
 
 CLICKHOUSE_RETRY_COOLDOWN_SECONDS = float(
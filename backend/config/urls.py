@@ -2,26 +2,31 @@
 URL configuration for apilens project.
 """
 
+import orjson
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.urls import path, include
 
 from api.router import api
 
 
+# Static payload: serialize once at import instead of on every hit.
+_ROOT_PAYLOAD = orjson.dumps(
+    {
+        "name": "APILens Backend",
+        "status": "ok",
+        "version": "v1",
+        "docs_url": "/api/v1/docs" if settings.API_DOCS_ENABLED else None,
+        "openapi_url": "/api/v1/openapi.json" if settings.API_DOCS_ENABLED else None,
+        "admin_url": "/admin/",
+    }
+)
+
+
 def root(request):
-    return JsonResponse(
-        {
-            "name": "APILens Backend",
-            "status": "ok",
-            "version": "v1",
-            "docs_url": "/api/v1/docs",
-            "openapi_url": "/api/v1/openapi.json",
-            "admin_url": "/admin/",
-        }
-    )
+    return HttpResponse(_ROOT_PAYLOAD, content_type="application/json")
 
 
 urlpatterns = [
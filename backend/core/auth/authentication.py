@@ -3,11 +3,17 @@ import logging
 from datetime import timedelta
 from typing import Optional
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
 from django.http import HttpRequest
 from django.utils import timezone
 from ninja.security import HttpBearer, APIKeyHeader
 
+from apps.auth.models import ApiKey, RefreshToken
 from apps.users.models import User
+from apps.users.services import UserService
 from core.exceptions.base import TokenExpiredError, TokenInvalidError
 
 from .jwt import verify_access_token
@@ -18,15 +24,40 @@ logger = logging.getLogger(__name__)
 # Only update last_used_at if more than 60s have passed (avoids DB write on every request)
 _LAST_USED_DEBOUNCE = timedelta(seconds=60)
 
+# Ingest clients send the same key on every batch; remember which key/app/owner
+# a hash resolves to instead of joining api_keys -> apps -> users each time.
+# Only with a shared cache (settings.AUTH_CACHE_ENABLED): revocation has to
+# reach every worker.
+_API_KEY_CACHE_TTL_SECONDS = 30
+
+
+def _api_key_cache_key(key_hash: str) -> str:
+    return f"api_key_auth:{key_hash}"
+
+
+def invalidate_cached_api_keys(key_hashes) -> None:
+    keys = [_api_key_cache_key(h) for h in key_hashes]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
 
 class JWTBearer(HttpBearer):
+    def __call__(self, request: HttpRequest) -> Optional[User]:
+        # Read straight from META: request.headers builds a full header
+        # mapping on first access, which nothing else on this path needs.
+        auth_value = request.META.get("HTTP_AUTHORIZATION")
+        if not auth_value:
+            return None
+        scheme, _, token = auth_value.partition(" ")
+        if scheme.lower() != self.openapi_scheme:
+            return None
+        return self.authenticate(request, token)
+
     def authenticate(self, request: HttpRequest, token: str) -> Optional[User]:
         try:
             claims = verify_access_token(token)
 
-            user = User.objects.filter(
-                id=claims["sub"], is_active=True
-            ).first()
+            user = UserService.get_active_user(claims["sub"])
             if user is None:
                 return None
 
@@ -48,13 +79,18 @@ class JWTBearer(HttpBearer):
         except (TokenExpiredError, TokenInvalidError):
             return None
         except Exception as e:
-            logger.error(f"Unexpected authentication error: {e}")
+            logger.error("Unexpected authentication error: %s", e)
             return None
 
     @staticmethod
     def _touch_session(token_family: str) -> None:
+        # cache.add only succeeds once per debounce window, so most requests
+        # skip the UPDATE round-trip entirely.
+        if not cache.add(
+            f"session_touch:{token_family}", 1, _LAST_USED_DEBOUNCE.total_seconds()
+        ):
+            return
         try:
-            from apps.auth.models import RefreshToken
             now = timezone.now()
             threshold = now - _LAST_USED_DEBOUNCE
             RefreshToken.objects.filter(
@@ -76,47 +112,62 @@ class JWTBearerOptional(JWTBearer):
 class ApiKeyAuth(APIKeyHeader):
     param_name = "X-API-Key"
 
+    def _get_key(self, request: HttpRequest) -> Optional[str]:
+        # Same header as param_name, read from META to skip building request.headers.
+        return request.META.get("HTTP_X_API_KEY")
+
     def authenticate(self, request: HttpRequest, key: Optional[str]) -> Optional[User]:
         if not key:
             return None
 
         try:
-            from apps.auth.models import ApiKey
-
             key_hash = hashlib.sha256(key.encode()).hexdigest()
-            api_key = (
-                ApiKey.objects.active()
-                .select_related("app", "app__owner")
-                .filter(
-                    key_hash=key_hash,
-                    app__is_active=True,
-                    app__owner__is_active=True,
+            cache_key = _api_key_cache_key(key_hash)
+            use_cache = settings.AUTH_CACHE_ENABLED
+            resolved = cache.get(cache_key) if use_cache else None
+            if resolved is None:
+                resolved = (
+                    ApiKey.objects.active()
+                    .filter(
+                        key_hash=key_hash,
+                        app__is_active=True,
+                        app__owner__is_active=True,
+                    )
+                    .values_list("id", "app_id", "app__owner_id")
+                    .first()
                 )
-                .first()
-            )
-            if api_key is None:
+                if resolved is None:
+                    return None
+                if use_cache:
+                    cache.set(cache_key, resolved, _API_KEY_CACHE_TTL_SECONDS)
+
+            key_id, app_id, owner_id = resolved
+            user = UserService.get_active_user(owner_id)
+            if user is None:
                 return None
 
-            user = api_key.app.owner
             request.tenant_context = TenantContext(
                 tenant_id=str(user.id),
                 user_id=str(user.id),
                 email=user.email,
-                app_id=str(api_key.app_id),
+                app_id=str(app_id),
             )
             request._auth_method = "api_key"
 
             # Touch last_used_at (debounced)
-            now = timezone.now()
-            if (
-                api_key.last_used_at is None
-                or api_key.last_used_at < now - _LAST_USED_DEBOUNCE
+            if cache.add(
+                f"api_key_touch:{key_id}", 1, _LAST_USED_DEBOUNCE.total_seconds()
             ):
-                ApiKey.objects.filter(id=api_key.id).update(last_used_at=now)
+                now = timezone.now()
+                ApiKey.objects.filter(
+                    Q(last_used_at__isnull=True)
+                    | Q(last_used_at__lt=now - _LAST_USED_DEBOUNCE),
+                    id=key_id,
+                ).update(last_used_at=now)
 
             return user
         except Exception as e:
-            logger.error(f"API key authentication error: {e}")
+            logger.error("API key authentication error: %s", e)
             return None
 
 
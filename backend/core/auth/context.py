@@ -5,7 +5,7 @@ Tenant context for multi-tenant authentication.
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class TenantContext:
     """
     Context object attached to requests after authentication.
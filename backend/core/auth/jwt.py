@@ -1,4 +1,8 @@
+import hashlib
 import logging
+import threading
+import time
+from functools import lru_cache
 from typing import Any
 
 from django.conf import settings
@@ -9,18 +13,61 @@ from core.exceptions.base import TokenExpiredError, TokenInvalidError
 
 logger = logging.getLogger(__name__)
 
+# Clients reuse an access token for its whole lifetime, so verified claims are
+# kept in-process until the token expires instead of re-checking the signature
+# and re-parsing the payload on every request. Keys are digests, not raw tokens.
+_CLAIMS_CACHE_MAX_ENTRIES = 4096
+_claims_cache: dict[bytes, tuple[float, dict[str, Any]]] = {}
+_claims_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _signing_key() -> bytes:
+    # PyJWT re-encodes str keys on every encode/decode; prepare it once.
+    return settings.SECRET_KEY.encode("utf-8")
+
+
+# Signature and exp verification are PyJWT defaults; only presence of the
+# claims we read needs requesting. Built once rather than per decode.
+_ALGORITHMS = ["HS256"]
+_DECODE_OPTIONS = {"require": ["sub", "email", "exp", "type"]}
+
 
 def create_access_token(payload: dict[str, Any]) -> str:
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
+    return jwt.encode(payload, _signing_key(), algorithm="HS256")
+
+
+def _claims_cache_get(key: bytes) -> dict[str, Any] | None:
+    with _claims_cache_lock:
+        entry = _claims_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, claims = entry
+        if expires_at <= time.time():
+            del _claims_cache[key]
+            return None
+        return claims
+
+
+def _claims_cache_set(key: bytes, claims: dict[str, Any]) -> None:
+    with _claims_cache_lock:
+        if len(_claims_cache) >= _CLAIMS_CACHE_MAX_ENTRIES:
+            _claims_cache.pop(next(iter(_claims_cache)))
+        _claims_cache[key] = (float(claims["exp"]), claims)
 
 
 def verify_access_token(token: str) -> dict[str, Any]:
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    cached = _claims_cache_get(key)
+    if cached is not None:
+        return dict(cached)
+
     try:
         claims = jwt.decode(
             token,
-            settings.SECRET_KEY,
-            algorithms=["HS256"],
-            options={"require": ["sub", "email", "exp", "type"]},
+            _signing_key(),
+            algorithms=_ALGORITHMS,
+            options=_DECODE_OPTIONS,
         )
     except jwt.ExpiredSignatureError:
         raise TokenExpiredError()
@@ -30,4 +77,5 @@ def verify_access_token(token: str) -> dict[str, Any]:
     if claims.get("type") != "access":
         raise TokenInvalidError("Not an access token")
 
-    return claims
+    _claims_cache_set(key, claims)
+    return dict(claims)
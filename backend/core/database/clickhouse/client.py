@@ -152,9 +152,9 @@ class ClickHouseClient:
                 except Exception as retry_exc:
                     if self._is_connection_error(retry_exc):
                         self._mark_unavailable(retry_exc)
-                    logger.error("ClickHouse query retry failed: %s - %s", query[:100], str(retry_exc))
+                    logger.error("ClickHouse query retry failed: %s - %s", query[:100], retry_exc)
                     raise retry_exc
-            logger.error("ClickHouse query failed: %s - %s", query[:100], str(e))
+            logger.error("ClickHouse query failed: %s - %s", query[:100], e)
             raise
 
     def execute_raw(
@@ -212,7 +212,8 @@ class ClickHouseClient:
                 f"INSERT INTO {table} ({', '.join(columns)}) VALUES",
                 rows,
             )
-            logger.debug("Inserted %d rows into %s", len(rows), table)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Inserted %d rows into %s", len(rows), table)
             return result
         except Exception as e:
             if self._is_connection_error(e):
@@ -222,13 +223,14 @@ class ClickHouseClient:
                         f"INSERT INTO {table} ({', '.join(columns)}) VALUES",
                         rows,
                     )
-                    logger.debug("Inserted %d rows into %s (after reconnect)", len(rows), table)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Inserted %d rows into %s (after reconnect)", len(rows), table)
                     return result
                 except Exception as retry_exc:
                     if self._is_connection_error(retry_exc):
                         self._mark_unavailable(retry_exc)
                     raise retry_exc
-            logger.error("ClickHouse insert failed: %s - %s", table, str(e))
+            logger.error("ClickHouse insert failed: %s - %s", table, e)
             raise
 
     def ping(self) -> bool:
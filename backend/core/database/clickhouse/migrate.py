@@ -12,6 +12,8 @@ from .client import get_clickhouse_client
 
 logger = logging.getLogger(__name__)
 
+_MIGRATION_FILE_RE = re.compile(r"^(\d+)_(.+)\.sql$")
+
 
 class MigrationInfo(NamedTuple):
     """Information about a migration file."""
@@ -66,7 +68,7 @@ class ClickHouseMigrator:
 
         for sql_file in sorted(self.MIGRATIONS_DIR.glob("*.sql")):
             # Parse filename: 001_description.sql
-            match = re.match(r"^(\d+)_(.+)\.sql$", sql_file.name)
+            match = _MIGRATION_FILE_RE.match(sql_file.name)
             if match:
                 version = match.group(1)
                 name = match.group(2)
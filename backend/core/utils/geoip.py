@@ -1,5 +1,7 @@
 import ipaddress
 import logging
+import threading
+import time
 
 import httpx
 
@@ -7,6 +9,41 @@ logger = logging.getLogger(__name__)
 
 _PRIVATE_RESULT = "Local network"
 
+# Lookups hit an external service, so successful results are kept in-process
+# for a while instead of re-resolving the same address on every login/refresh.
+_CACHE_TTL_SECONDS = 3600
+_CACHE_MAX_ENTRIES = 1024
+_cache: dict[str, tuple[float, str]] = {}
+_cache_lock = threading.Lock()
+
+# Shared client so lookups reuse pooled keep-alive connections instead of
+# paying DNS + TCP setup on every call.
+_http = httpx.Client(
+    base_url="http://ip-api.com",
+    timeout=2.0,
+    limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+)
+
+
+def _cache_get(ip: str) -> str | None:
+    with _cache_lock:
+        entry = _cache.get(ip)
+        if entry is None:
+            return None
+        expires_at, location = entry
+        if expires_at < time.monotonic():
+            del _cache[ip]
+            return None
+        return location
+
+
+def _cache_set(ip: str, location: str) -> None:
+    with _cache_lock:
+        if len(_cache) >= _CACHE_MAX_ENTRIES:
+            # Evict the oldest insertion; dicts preserve insertion order.
+            _cache.pop(next(iter(_cache)))
+        _cache[ip] = (time.monotonic() + _CACHE_TTL_SECONDS, location)
+
 
 def _is_private(ip: str) -> bool:
     try:
@@ -15,26 +52,29 @@ def _is_private(ip: str) -> bool:
         return False
 
 
-def resolve_location(ip: str | None) -> str:
+def resolve_location(ip: str | None, timeout: float = 2.0) -> str:
     if not ip:
         return ""
 
     if _is_private(ip):
         return _PRIVATE_RESULT
 
+    cached = _cache_get(ip)
+    if cached is not None:
+        return cached
+
     try:
-        resp = httpx.get(
-            f"http://ip-api.com/json/{ip}",
-            params={"fields": "city,country"},
-            timeout=2.0,
-        )
+        resp = _http.get(f"/json/{ip}", params={"fields": "city,country"}, timeout=timeout)
         if resp.status_code == 200:
             data = resp.json()
             city = data.get("city", "")
             country = data.get("country", "")
             if city and country:
-                return f"{city}, {country}"
-            return country or city or ""
+                location = f"{city}, {country}"
+            else:
+                location = country or city or ""
+            _cache_set(ip, location)
+            return location
     except Exception:
         logger.debug("GeoIP lookup failed for %s", ip, exc_info=True)
 
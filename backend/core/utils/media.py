@@ -0,0 +1,20 @@
+"""
+Absolute URLs for uploaded media files.
+"""
+
+import os
+from datetime import datetime
+from functools import lru_cache
+
+from django.conf import settings
+
+
+@lru_cache(maxsize=1)
+def _media_base_url() -> str:
+    base = os.environ.get("DJANGO_BASE_URL", "http://localhost:8000")
+    return f"{base}{settings.MEDIA_URL}"
+
+
+def build_media_url(name: str, updated_at: datetime | None) -> str:
+    cache_bust = int(updated_at.timestamp()) if updated_at else ""
+    return f"{_media_base_url()}{name}?v={cache_bust}"
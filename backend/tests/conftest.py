@@ -0,0 +1,26 @@
+# Integration & E2E tests
+import pytest
+
+from apps.projects.models import App
+from apps.users.models import User
+
+
+@pytest.fixture
+def user(db) -> User:
+    return User.objects.create(email="owner@example.com", email_verified=True)
+
+
+@pytest.fixture
+def app(user) -> App:
+    return App.objects.create(owner=user, name="Demo", slug="demo")
+
+
+@pytest.fixture
+def shared_auth_cache(settings):
+    """Enable the cross-request auth caches against a clean local cache."""
+    from django.core.cache import cache
+
+    settings.AUTH_CACHE_ENABLED = True
+    cache.clear()
+    yield
+    cache.clear()
@@ -0,0 +1,29 @@
+import pytest
+
+from apps.auth.models import ApiKey
+from apps.auth.services import ApiKeyService
+from apps.projects.models import App
+from apps.projects.services import AppService
+from apps.users.models import User
+from core.exceptions.base import NotFoundError
+
+
+def test_delete_app_revokes_only_its_keys(user, app, django_capture_on_commit_callbacks):
+    other_app = App.objects.create(owner=user, name="Other", slug="other")
+    stranger = User.objects.create(email="stranger@example.com", email_verified=True)
+    same_slug = App.objects.create(owner=stranger, name="Demo", slug="demo")
+    _, key = ApiKeyService.create_key(app, "ci")
+    _, other_key = ApiKeyService.create_key(other_app, "ci")
+    _, stranger_key = ApiKeyService.create_key(same_slug, "ci")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        AppService.delete_app(user, "demo")
+
+    revoked = dict(ApiKey.objects.values_list("id", "is_revoked"))
+    assert revoked == {key.id: True, other_key.id: False, stranger_key.id: False}
+    assert not App.objects.get(pk=app.pk).is_active
+
+
+def test_delete_missing_app_is_not_found(user):
+    with pytest.raises(NotFoundError):
+        AppService.delete_app(user, "missing")
@@ -0,0 +1,60 @@
+import pytest
+
+from apps.auth.services import ApiKeyService
+from apps.users.services import UserService
+from core.auth.authentication import api_key_auth
+
+
+def _authenticate_key(rf, raw_key):
+    return api_key_auth(rf.post("/api/v1/ingest/requests", HTTP_X_API_KEY=raw_key))
+
+
+@pytest.mark.usefixtures("shared_auth_cache")
+class TestUserCacheInvalidation:
+    def test_deactivation_drops_cached_user(self, user, django_capture_on_commit_callbacks):
+        assert UserService.get_active_user(user.id) is not None
+
+        with django_capture_on_commit_callbacks(execute=True):
+            UserService.deactivate_user(user)
+
+        assert UserService.get_active_user(user.id) is None
+
+    def test_login_refreshes_cached_last_login(self, user, django_capture_on_commit_callbacks):
+        assert UserService.get_active_user(user.id).last_login_at is None
+
+        with django_capture_on_commit_callbacks(execute=True):
+            UserService.update_last_login(user)
+
+        assert UserService.get_active_user(user.id).last_login_at == user.last_login_at
+
+
+@pytest.mark.usefixtures("shared_auth_cache")
+class TestApiKeyCacheInvalidation:
+    def test_revoked_key_is_rejected(self, rf, app, django_capture_on_commit_callbacks):
+        raw_key, key = ApiKeyService.create_key(app, "ci")
+        assert _authenticate_key(rf, raw_key) is not None
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ApiKeyService.revoke_key(app, str(key.id))
+
+        assert _authenticate_key(rf, raw_key) is None
+
+    def test_revoke_all_rejects_every_key(self, rf, app, django_capture_on_commit_callbacks):
+        raw_keys = [ApiKeyService.create_key(app, name)[0] for name in ("a", "b")]
+        assert all(_authenticate_key(rf, raw) is not None for raw in raw_keys)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ApiKeyService.revoke_all_for_app(app)
+
+        assert all(_authenticate_key(rf, raw) is None for raw in raw_keys)
+
+
+def test_without_shared_cache_revocation_is_immediate(rf, app, settings):
+    # No shared cache: nothing is cached, so revoking needs no invalidation.
+    settings.AUTH_CACHE_ENABLED = False
+    raw_key, key = ApiKeyService.create_key(app, "ci")
+    assert _authenticate_key(rf, raw_key) is not None
+
+    ApiKeyService.revoke_key(app, str(key.id))
+
+    assert _authenticate_key(rf, raw_key) is None
@@ -0,0 +1,83 @@
+import secrets
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.auth.models import MagicLinkToken
+from apps.auth.services import AuthService, MagicLinkService, _hash_token
+from core.exceptions.base import TokenInvalidError
+
+
+def _issue_token(email: str = "new@example.com") -> str:
+    raw_token = secrets.token_urlsafe(48)
+    MagicLinkToken.objects.create(
+        email=email,
+        token_hash=_hash_token(raw_token),
+        expires_at=timezone.now() + timedelta(minutes=15),
+    )
+    return raw_token
+
+
+@pytest.mark.django_db
+def test_verify_returns_email_and_claims_token():
+    raw_token = _issue_token()
+
+    assert MagicLinkService.verify(raw_token) == "new@example.com"
+    assert MagicLinkToken.objects.get(token_hash=_hash_token(raw_token)).is_used
+
+
+@pytest.mark.django_db
+def test_second_verification_is_rejected():
+    raw_token = _issue_token()
+    MagicLinkService.verify(raw_token)
+
+    with pytest.raises(TokenInvalidError):
+        MagicLinkService.verify(raw_token)
+
+
+@pytest.mark.django_db
+def test_concurrent_claim_after_read_is_rejected(monkeypatch):
+    # Another request claims the token between this request's read and its
+    # claim: the stale row still says unused, the conditional UPDATE must not.
+    raw_token = _issue_token()
+    stale = MagicLinkToken.objects.get(token_hash=_hash_token(raw_token))
+    MagicLinkToken.objects.filter(pk=stale.pk).update(is_used=True)
+    monkeypatch.setattr(MagicLinkToken.objects, "get", lambda **kwargs: stale)
+
+    with pytest.raises(TokenInvalidError):
+        MagicLinkService.verify(raw_token)
+
+
+@pytest.mark.django_db
+def test_verify_magic_link_creates_verified_user():
+    raw_token = _issue_token()
+
+    access_token, refresh_token, user = AuthService.verify_magic_link(raw_token)
+
+    assert access_token and refresh_token
+    assert user.email_verified
+    assert user.last_login_at is not None
+
+
+@pytest.mark.django_db
+def test_create_and_send_emails_after_commit(django_capture_on_commit_callbacks, mailoutbox):
+    with django_capture_on_commit_callbacks(execute=True):
+        MagicLinkService.create_and_send("new@example.com")
+
+    assert len(mailoutbox) == 1
+    assert mailoutbox[0].to == ["new@example.com"]
+
+
+@pytest.mark.django_db
+def test_failed_email_discards_token(django_capture_on_commit_callbacks, monkeypatch):
+    def fail(email, verify_url):
+        raise ConnectionRefusedError("smtp down")
+
+    monkeypatch.setattr(MagicLinkService, "_send_email", staticmethod(fail))
+
+    with pytest.raises(ConnectionRefusedError):
+        with django_capture_on_commit_callbacks(execute=True):
+            MagicLinkService.create_and_send("new@example.com")
+
+    assert not MagicLinkToken.objects.filter(email="new@example.com").exists()
@@ -0,0 +1,43 @@
+import json
+import uuid
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+
+from ninja.responses import NinjaJSONEncoder
+
+from api.renderers import ORJSONRenderer
+
+
+def _render(data):
+    return ORJSONRenderer().render(None, data, response_status=200)
+
+
+def test_datetimes_keep_millisecond_precision():
+    payload = {
+        "created_at": datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc),
+        "updated_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "day": date(2024, 1, 2),
+        "at": time(1, 2, 3, 456789),
+    }
+
+    assert json.loads(_render(payload)) == {
+        "created_at": "2024-01-02T03:04:05.123Z",
+        "updated_at": "2024-01-02T03:04:05Z",
+        "day": "2024-01-02",
+        "at": "01:02:03.456",
+    }
+
+
+def test_matches_ninja_encoder():
+    payload = {
+        "id": uuid.UUID(int=1),
+        "seen_at": datetime(2024, 6, 30, 23, 59, 59, 999999, tzinfo=timezone.utc),
+        "cost": Decimal("1.50"),
+        "tags": ["a", "b"],
+        "count": 3,
+        "missing": None,
+    }
+
+    assert json.loads(_render(payload)) == json.loads(
+        json.dumps(payload, cls=NinjaJSONEncoder)
+    )
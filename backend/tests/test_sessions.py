@@ -0,0 +1,54 @@
+from apps.auth import services
+from apps.auth.models import RefreshToken
+from apps.auth.services import MAX_LOCATION_LOOKUPS, UNKNOWN_LOCATION, TokenService
+
+
+def _login_from(user, *ips):
+    # A new login from the same device replaces the old session, so give
+    # every address its own device.
+    for n, ip in enumerate(ips):
+        TokenService.create_refresh_token(user, device_info=f"Device {n}", ip_address=ip)
+
+
+def test_listing_stores_resolved_locations(user, monkeypatch):
+    _login_from(user, "203.0.113.1")
+    monkeypatch.setattr(services, "resolve_location", lambda ip, timeout: "Paris, France")
+
+    sessions = TokenService.get_active_sessions(user)
+
+    assert [s.location for s in sessions] == ["Paris, France"]
+    assert RefreshToken.objects.get().location == "Paris, France"
+
+
+def test_failed_lookup_is_not_retried(user, monkeypatch):
+    _login_from(user, "203.0.113.1")
+    lookups = []
+
+    def resolve(ip, timeout):
+        lookups.append(ip)
+        return ""
+
+    monkeypatch.setattr(services, "resolve_location", resolve)
+
+    assert TokenService.get_active_sessions(user)[0].location == UNKNOWN_LOCATION
+    TokenService.get_active_sessions(user)
+
+    assert lookups == ["203.0.113.1"]
+
+
+def test_lookups_are_capped_per_listing(user, monkeypatch):
+    ips = [f"203.0.113.{n}" for n in range(1, MAX_LOCATION_LOOKUPS + 3)]
+    _login_from(user, *ips)
+    lookups = []
+
+    def resolve(ip, timeout):
+        lookups.append(ip)
+        return "Paris, France"
+
+    monkeypatch.setattr(services, "resolve_location", resolve)
+
+    TokenService.get_active_sessions(user)
+    assert len(lookups) == MAX_LOCATION_LOOKUPS
+
+    TokenService.get_active_sessions(user)
+    assert sorted(lookups) == sorted(ips)
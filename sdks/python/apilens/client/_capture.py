@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Any, Iterable, Iterator
 
 from .client import ApiLensClient
 
@@ -17,33 +17,124 @@ class CaptureContext:
     consumer_id: str = ""
     consumer_name: str = ""
     consumer_group: str = ""
-    request_payload: str = ""
+    request_payload: bytes | str = ""
+    content_type: str = ""
+
+
+_TEXTUAL_CONTENT_TYPES = frozenset(
+    {
+        "application/json",
+        "application/x-www-form-urlencoded",
+        "application/xml",
+        "application/javascript",
+        "application/graphql",
+        "application/x-ndjson",
+    }
+)
+
+
+def _is_textual(content_type: str | None) -> bool:
+    """Whether a body of this type is worth capturing as text.
+
+    Binary bodies (images, archives, multipart uploads) would only decode to
+    mojibake, so middleware skips buffering them. A missing type is captured.
+    """
+    media_type = (content_type or "").partition(";")[0].strip().lower()
+    return (
+        not media_type
+        or media_type.startswith("text/")
+        or media_type in _TEXTUAL_CONTENT_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+class _TeeStream:
+    """Request-body stream proxy that keeps the first ``cap`` bytes read.
+
+    Capture happens as the application consumes the stream, so middleware never
+    buffers the body itself and never has to rewind it.
+    """
+
+    def __init__(self, stream: Any, cap: int) -> None:
+        self._stream = stream
+        self._cap = cap
+        self.captured = bytearray()
+
+    def _keep(self, data: bytes) -> bytes:
+        remaining = self._cap - len(self.captured)
+        if data and remaining > 0:
+            self.captured.extend(memoryview(data)[:remaining])
+        return data
+
+    def read(self, *args: Any) -> bytes:
+        return self._keep(self._stream.read(*args))
+
+    def read1(self, *args: Any) -> bytes:
+        return self._keep(self._stream.read1(*args))
+
+    def readinto(self, buffer: Any) -> int:
+        # Werkzeug's LimitedStream reads through readinto when it is available.
+        readinto = getattr(self._stream, "readinto", None)
+        if readinto is None:
+            data = self._stream.read(len(buffer))
+            count = len(data)
+            buffer[:count] = data
+        else:
+            count = readinto(buffer) or 0
+        if count:
+            self._keep(memoryview(buffer)[:count])
+        return count
+
+    def readline(self, *args: Any) -> bytes:
+        return self._keep(self._stream.readline(*args))
 
+    def readlines(self, *args: Any) -> list[bytes]:
+        lines = self._stream.readlines(*args)
+        for line in lines:
+            self._keep(line)
+        return lines
 
+    def __iter__(self) -> Iterator[bytes]:
+        for line in self._stream:
+            yield self._keep(line)
 
-def _headers_to_dict(headers: Iterable[tuple[bytes, bytes]]) -> dict[str, str]:
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+# The only request headers capture reads; everything else is never decoded.
+_CAPTURED_HEADERS = {
+    b"content-length": "content-length",
+    b"content-type": "content-type",
+    b"user-agent": "user-agent",
+    b"x-forwarded-for": "x-forwarded-for",
+    b"x-real-ip": "x-real-ip",
+}
+
+
+def _captured_headers(headers: Iterable[tuple[bytes, bytes]]) -> dict[str, str]:
     out: dict[str, str] = {}
     for raw_k, raw_v in headers:
-        key = raw_k.decode("latin-1").lower()
-        value = raw_v.decode("latin-1")
-        out[key] = value
+        key = _CAPTURED_HEADERS.get(raw_k.lower())
+        if key is not None:
+            out[key] = raw_v.decode("latin-1")
     return out
 
 
 
 def _normalize_path(path: str) -> str:
+    # Almost every path is already clean; hand it back without allocating.
+    if path and path[0] == "/" and "?" not in path and not path[-1].isspace():
+        return path
     value = (path or "/").strip()
     if not value:
         return "/"
-    q_index = value.find("?")
-    if q_index != -1:
-        value = value[:q_index]
+    value = value.partition("?")[0]
     if not value.startswith("/"):
         value = f"/{value}"
     return value
 
 
-
 def _to_int(raw: str | None, default: int = 0) -> int:
     if not raw:
         return default
@@ -54,11 +145,18 @@ def _to_int(raw: str | None, default: int = 0) -> int:
 
 
 
-def _extract_ip(headers: dict[str, str], fallback: str = "") -> str:
-    xff = headers.get("x-forwarded-for", "").strip()
+def _extract_ip(xff: str | None, real_ip: str | None, remote: str | None = "") -> str:
+    """First client address from X-Forwarded-For, then X-Real-IP, then the peer."""
     if xff:
-        return xff.split(",", 1)[0].strip()
-    return headers.get("x-real-ip", "").strip() or fallback
+        # Most requests pass through a single proxy hop.
+        ip = (xff if "," not in xff else xff.partition(",")[0]).strip()
+        if ip:
+            return ip
+    if real_ip:
+        ip = real_ip.strip()
+        if ip:
+            return ip
+    return remote or ""
 
 
 
@@ -67,6 +165,29 @@ def _extract_user_agent(headers: dict[str, str]) -> str:
 
 
 
+def build_ctx(
+    method: str | None,
+    path: str | None,
+    raw_headers: Iterable[tuple[bytes, bytes]],
+    *,
+    client_ip: str = "",
+) -> CaptureContext:
+    headers = _captured_headers(raw_headers)
+    return CaptureContext(
+        method=(method or "GET").upper(),
+        path=_normalize_path(path or "/"),
+        request_size=_to_int(headers.get("content-length"), 0),
+        ip_address=_extract_ip(
+            headers.get("x-forwarded-for"),
+            headers.get("x-real-ip"),
+            client_ip,
+        ),
+        user_agent=_extract_user_agent(headers),
+        content_type=headers.get("content-type", ""),
+    )
+
+
+
 def capture_response(
     client: ApiLensClient,
     ctx: CaptureContext,
@@ -75,8 +196,10 @@ def capture_response(
     response_size: int,
     started_at: float,
     environment: str | None = None,
-    response_payload: str = "",
+    response_payload: bytes | str = "",
 ) -> None:
+    if not client.config.enabled:
+        return
     elapsed_ms = max((time.perf_counter() - started_at) * 1000.0, 0.0)
     client.capture(
         method=ctx.method,
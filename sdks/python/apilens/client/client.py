@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import base64
+import gzip
+import http.client
 import json
 import logging
 import ssl
 import threading
 import time
-import urllib.error
 import urllib.parse
 import urllib.request
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
@@ -16,6 +19,51 @@ from .models import LogRecord, RequestRecord
 
 logger = logging.getLogger("apilens")
 
+_UTC = timezone.utc
+
+# Batches handed to the sender pool but not yet delivered; once reached, the
+# flush thread waits instead of piling up more batches in memory.
+_MAX_INFLIGHT_BATCHES = 4
+
+try:  # optional: noticeably faster batch encoding when installed
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+# Below this size gzip framing overhead outweighs the savings.
+_COMPRESS_MIN_BYTES = 1024
+
+# Errors from writing to or reading from a keep-alive socket the peer closed.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+def _dumps(payload: dict[str, object]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _proxy_for(url: urllib.parse.SplitResult) -> urllib.parse.SplitResult | None:
+    # Same resolution urllib applies: HTTP(S)_PROXY, minus NO_PROXY hosts.
+    proxy = urllib.request.getproxies().get(url.scheme)
+    if not proxy or urllib.request.proxy_bypass(url.hostname or ""):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    return urllib.parse.urlsplit(proxy)
+
+
+def _proxy_auth_headers(proxy: urllib.parse.SplitResult) -> dict[str, str]:
+    if not proxy.username:
+        return {}
+    creds = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(creds.encode()).decode("ascii")}
+
 
 @dataclass(slots=True)
 class ApiLensConfig:
@@ -38,6 +86,8 @@ class ApiLensConfig:
 
     enabled: bool = True
     user_agent: str = "apilens-python-sdk/0.1.3"
+    # "gzip" compresses ingest bodies; leave empty for servers that predate it.
+    compression: str = ""
 
 
 class ApiLensClient:
@@ -49,15 +99,53 @@ class ApiLensClient:
             raise ValueError("batch_size must be > 0")
         if config.max_queue_size <= 0:
             raise ValueError("max_queue_size must be > 0")
+        if config.compression not in ("", "gzip"):
+            raise ValueError("compression must be '' or 'gzip'")
 
         self.config = config
-        self._queue: deque[RequestRecord] = deque()
-        self._log_queue: deque[LogRecord] = deque()
+        # Bounded deques evict the oldest record on append, and append/popleft
+        # are atomic, so the capture path does not need to take self._lock.
+        self._queue: deque[RequestRecord] = deque(maxlen=config.max_queue_size)
+        self._log_queue: deque[LogRecord] = deque(maxlen=config.max_queue_size)
         self._lock = threading.Lock()
         self._stop = threading.Event()
-        self._wakeup = threading.Event()
+        # Signalled when a queue reaches batch_size (or on shutdown); the flush
+        # thread re-checks queue sizes under it, so no wakeup can be missed.
+        self._wakeup = threading.Condition()
         self._thread: threading.Thread | None = None
         self._dropped = 0
+        # Batches are POSTed from a small pool so a slow or retrying request
+        # does not stall draining the queues.
+        self._executor: ThreadPoolExecutor | None = None
+        self._inflight = threading.BoundedSemaphore(_MAX_INFLIGHT_BATCHES)
+        # Each sending thread keeps one keep-alive connection to the ingest
+        # host, so TLS is negotiated once per thread rather than per batch.
+        self._local = threading.local()
+        self._conns: set[http.client.HTTPConnection] = set()
+        self._conn_lock = threading.Lock()
+        self._ssl_context: ssl.SSLContext | None = None
+
+        base_url = config.base_url.rstrip("/") + "/"
+        self._ingest_url = urllib.parse.urlsplit(
+            urllib.parse.urljoin(base_url, config.ingest_path.lstrip("/"))
+        )
+        self._logs_ingest_url = urllib.parse.urlsplit(
+            urllib.parse.urljoin(base_url, config.logs_ingest_path.lstrip("/"))
+        )
+        self._headers = {
+            "Content-Type": "application/json",
+            "X-API-Key": config.api_key,
+            "User-Agent": config.user_agent,
+        }
+        # Plain-HTTP ingest goes through the proxy with absolute-form targets;
+        # HTTPS ingest is tunnelled with CONNECT.
+        self._proxy = _proxy_for(self._ingest_url)
+        self._proxy_headers: dict[str, str] = {}
+        if self._proxy is not None:
+            self._proxy_headers = _proxy_auth_headers(self._proxy)
+            if self._ingest_url.scheme != "https":
+                self._headers.update(self._proxy_headers)
+        self._gzip_headers = {**self._headers, "Content-Encoding": "gzip"}
 
         if start_worker and self.config.enabled:
             self.start()
@@ -66,19 +154,34 @@ class ApiLensClient:
         if self._thread and self._thread.is_alive():
             return
         self._stop.clear()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="apilens-http")
         self._thread = threading.Thread(target=self._run_loop, daemon=True, name="apilens-flush")
         self._thread.start()
 
     def shutdown(self, *, flush: bool = True, timeout: float = 10.0) -> None:
-        if flush:
-            self.flush_all()
-
         self._stop.set()
-        self._wakeup.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
 
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=timeout)
 
+        # Let batches already handed to the pool finish before the final drain.
+        # If the flush thread is still running (e.g. blocked on in-flight
+        # batches), it may yet submit, so the pool is left to it.
+        if self._executor is not None and not (self._thread and self._thread.is_alive()):
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        if flush:
+            self.flush_all()
+
+        with self._conn_lock:
+            for conn in self._conns:
+                conn.close()
+            self._conns.clear()
+
     def __enter__(self) -> "ApiLensClient":
         self.start()
         return self
@@ -105,12 +208,14 @@ class ApiLensClient:
         consumer_id: str = "",
         consumer_name: str = "",
         consumer_group: str = "",
-        request_payload: str = "",
-        response_payload: str = "",
+        request_payload: bytes | str = "",
+        response_payload: bytes | str = "",
         environment: str | None = None,
     ) -> None:
+        if not self.config.enabled:
+            return
         record = RequestRecord(
-            timestamp=timestamp or datetime.now(tz=timezone.utc),
+            timestamp=timestamp or datetime.now(_UTC),
             environment=environment or self.config.environment,
             method=method,
             path=path,
@@ -131,15 +236,19 @@ class ApiLensClient:
     def capture_record(self, record: RequestRecord) -> None:
         if not self.config.enabled:
             return
-        with self._lock:
-            if len(self._queue) >= self.config.max_queue_size:
-                self._queue.popleft()
+        queue = self._queue
+        if len(queue) >= self.config.max_queue_size:
+            with self._lock:
                 self._dropped += 1
-            self._queue.append(record)
-            queue_size = len(self._queue)
+        queue.append(record)
 
-        if queue_size >= self.config.batch_size:
-            self._wakeup.set()
+        # Wake the flush thread only when the queue fills a batch, so later
+        # captures stay lock-free; it re-checks sizes before waiting again,
+        # and a racing append that skips the exact size is picked up on the
+        # next flush_interval tick.
+        if len(queue) == self.config.batch_size:
+            with self._wakeup:
+                self._wakeup.notify()
 
     def capture_many(self, records: list[RequestRecord]) -> None:
         for record in records:
@@ -164,8 +273,10 @@ class ApiLensClient:
         attributes: dict[str, str | int | float | bool] | None = None,
         environment: str | None = None,
     ) -> None:
+        if not self.config.enabled:
+            return
         record = LogRecord(
-            timestamp=timestamp or datetime.now(tz=timezone.utc),
+            timestamp=timestamp or datetime.now(_UTC),
             environment=environment or self.config.environment,
             level=level,
             message=message,
@@ -186,15 +297,15 @@ class ApiLensClient:
     def capture_log_record(self, record: LogRecord) -> None:
         if not self.config.enabled:
             return
-        with self._lock:
-            if len(self._log_queue) >= self.config.max_queue_size:
-                self._log_queue.popleft()
+        queue = self._log_queue
+        if len(queue) >= self.config.max_queue_size:
+            with self._lock:
                 self._dropped += 1
-            self._log_queue.append(record)
-            queue_size = len(self._log_queue)
+        queue.append(record)
 
-        if queue_size >= self.config.batch_size:
-            self._wakeup.set()
+        if len(queue) == self.config.batch_size:
+            with self._wakeup:
+                self._wakeup.notify()
 
     def capture_many_logs(self, records: list[LogRecord]) -> None:
         for record in records:
@@ -204,23 +315,13 @@ class ApiLensClient:
         batch = self._pop_batch(self.config.batch_size)
         if not batch:
             return 0
-
-        sent = self._send_batch_with_retry(batch)
-        if not sent:
-            logger.warning("API Lens ingest failed; dropping batch of %d records", len(batch))
-            return 0
-        return len(batch)
+        return self._deliver(batch)
 
     def flush_logs_once(self) -> int:
         batch = self._pop_log_batch(self.config.batch_size)
         if not batch:
             return 0
-
-        sent = self._send_log_batch_with_retry(batch)
-        if not sent:
-            logger.warning("API Lens log ingest failed; dropping batch of %d records", len(batch))
-            return 0
-        return len(batch)
+        return self._deliver_logs(batch)
 
     def flush_all(self) -> int:
         total = 0
@@ -234,31 +335,67 @@ class ApiLensClient:
 
     def _run_loop(self) -> None:
         while not self._stop.is_set():
-            self._wakeup.wait(self.config.flush_interval)
-            self._wakeup.clear()
+            with self._wakeup:
+                self._wakeup.wait_for(self._batch_ready, timeout=self.config.flush_interval)
             try:
-                self.flush_once()
-                self.flush_logs_once()
+                batch = self._pop_batch(self.config.batch_size)
+                if batch:
+                    self._submit(self._deliver, batch)
+                log_batch = self._pop_log_batch(self.config.batch_size)
+                if log_batch:
+                    self._submit(self._deliver_logs, log_batch)
             except Exception:  # pragma: no cover
                 logger.exception("Unexpected error while flushing API Lens queue")
 
+    def _submit(self, deliver, batch: list) -> None:
+        executor = self._executor
+        if executor is None:
+            deliver(batch)
+            return
+        self._inflight.acquire()
+        try:
+            future = executor.submit(deliver, batch)
+        except BaseException:
+            self._inflight.release()
+            raise
+        future.add_done_callback(self._on_delivered)
+
+    def _on_delivered(self, future: Future) -> None:
+        self._inflight.release()
+        if future.exception() is not None:  # pragma: no cover
+            logger.error("Unexpected error while sending API Lens batch", exc_info=future.exception())
+
+    def _deliver(self, batch: list[RequestRecord]) -> int:
+        if not self._send_batch_with_retry(batch):
+            logger.warning("API Lens ingest failed; dropping batch of %d records", len(batch))
+            return 0
+        return len(batch)
+
+    def _deliver_logs(self, batch: list[LogRecord]) -> int:
+        if not self._send_log_batch_with_retry(batch):
+            logger.warning("API Lens log ingest failed; dropping batch of %d records", len(batch))
+            return 0
+        return len(batch)
+
+    def _batch_ready(self) -> bool:
+        batch_size = self.config.batch_size
+        return (
+            self._stop.is_set()
+            or len(self._queue) >= batch_size
+            or len(self._log_queue) >= batch_size
+        )
+
     def _pop_batch(self, size: int) -> list[RequestRecord]:
+        queue = self._queue
+        popleft = queue.popleft
         with self._lock:
-            if not self._queue:
-                return []
-            batch: list[RequestRecord] = []
-            for _ in range(min(size, len(self._queue))):
-                batch.append(self._queue.popleft())
-            return batch
+            return [popleft() for _ in range(min(size, len(queue)))]
 
     def _pop_log_batch(self, size: int) -> list[LogRecord]:
+        queue = self._log_queue
+        popleft = queue.popleft
         with self._lock:
-            if not self._log_queue:
-                return []
-            batch: list[LogRecord] = []
-            for _ in range(min(size, len(self._log_queue))):
-                batch.append(self._log_queue.popleft())
-            return batch
+            return [popleft() for _ in range(min(size, len(queue)))]
 
     def _send_batch_with_retry(self, batch: list[RequestRecord]) -> bool:
         last_error: Exception | None = None
@@ -282,44 +419,22 @@ class ApiLensClient:
 
     def _send_batch(self, batch: list[RequestRecord]) -> None:
         payload = {"requests": [r.to_wire() for r in batch]}
-        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
-
-        ingest_url = urllib.parse.urljoin(
-            self.config.base_url.rstrip("/") + "/",
-            self.config.ingest_path.lstrip("/"),
-        )
-
-        req = urllib.request.Request(
-            ingest_url,
-            method="POST",
-            data=body,
-            headers={
-                "Content-Type": "application/json",
-                "X-API-Key": self.config.api_key,
-                "User-Agent": self.config.user_agent,
-            },
-        )
+        body = _dumps(payload)
 
         try:
-            ssl_context = None
-            if self.config.verify_tls:
-                ssl_context = ssl.create_default_context(
-                    cafile=self.config.ca_bundle_path or None
-                )
-            else:
-                ssl_context = ssl._create_unverified_context()  # noqa: SLF001
-
-            with urllib.request.urlopen(req, timeout=self.config.timeout, context=ssl_context) as resp:
-                status = getattr(resp, "status", 200)
-                if status >= 400:
-                    raise RuntimeError(f"API Lens ingest returned status={status}")
-        except urllib.error.HTTPError as exc:
-            if 400 <= exc.code < 500 and exc.code != 429:
-                raise RuntimeError(f"Non-retryable ingest error status={exc.code}") from exc
-            raise RuntimeError(f"Retryable ingest error status={exc.code}") from exc
-        except urllib.error.URLError as exc:
+            status = self._post(self._ingest_url, body)
+        except (OSError, http.client.HTTPException) as exc:
             raise RuntimeError(f"Ingest network error: {exc}") from exc
 
+        if 300 <= status < 400:
+            # Redirects are not followed: POST bodies would be dropped or
+            # replayed as GET. Point base_url at the final ingest host instead.
+            raise RuntimeError(f"Unexpected ingest redirect status={status}")
+        if 400 <= status < 500 and status != 429:
+            raise RuntimeError(f"Non-retryable ingest error status={status}")
+        if status >= 400:
+            raise RuntimeError(f"Retryable ingest error status={status}")
+
     def _send_log_batch_with_retry(self, batch: list[LogRecord]) -> bool:
         last_error: Exception | None = None
         for attempt in range(self.config.max_retries + 1):
@@ -342,40 +457,89 @@ class ApiLensClient:
 
     def _send_log_batch(self, batch: list[LogRecord]) -> None:
         payload = {"logs": [r.to_wire() for r in batch]}
-        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        body = _dumps(payload)
 
-        ingest_url = urllib.parse.urljoin(
-            self.config.base_url.rstrip("/") + "/",
-            self.config.logs_ingest_path.lstrip("/"),
-        )
+        try:
+            status = self._post(self._logs_ingest_url, body)
+        except (OSError, http.client.HTTPException) as exc:
+            raise RuntimeError(f"Logs ingest network error: {exc}") from exc
 
-        req = urllib.request.Request(
-            ingest_url,
-            method="POST",
-            data=body,
-            headers={
-                "Content-Type": "application/json",
-                "X-API-Key": self.config.api_key,
-                "User-Agent": self.config.user_agent,
-            },
-        )
+        if 300 <= status < 400:
+            # Not followed; see _send_batch.
+            raise RuntimeError(f"Unexpected logs ingest redirect status={status}")
+        if 400 <= status < 500 and status != 429:
+            raise RuntimeError(f"Non-retryable logs ingest error status={status}")
+        if status >= 400:
+            raise RuntimeError(f"Retryable logs ingest error status={status}")
+
+    def _post(self, url: urllib.parse.SplitResult, body: bytes) -> int:
+        if self._proxy is not None and url.scheme != "https":
+            target = url.geturl()
+        else:
+            target = url.path or "/"
+            if url.query:
+                target = f"{target}?{url.query}"
+
+        headers = self._headers
+        if self.config.compression == "gzip" and len(body) >= _COMPRESS_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers = self._gzip_headers
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._open_connection(url)
+            with self._conn_lock:
+                self._conns.add(conn)
+        # An idle keep-alive socket may have been dropped by the server or a
+        # proxy; that only shows up on the next request, so retry it once on
+        # a fresh connection before it counts as a failed attempt.
+        reused = conn.sock is not None
+        while True:
+            try:
+                conn.request("POST", target, body=body, headers=headers)
+                resp = conn.getresponse()
+                # Drain the body so the connection can carry the next request.
+                resp.read()
+                break
+            except _STALE_CONNECTION_ERRORS:
+                # Closed connections reconnect on the next request().
+                conn.close()
+                if not reused:
+                    raise
+                reused = False
+            except BaseException:
+                conn.close()
+                raise
+        if resp.will_close:
+            conn.close()
+        return resp.status
+
+    def _open_connection(self, parts: urllib.parse.SplitResult) -> http.client.HTTPConnection:
+        proxy = self._proxy
+        if parts.scheme != "https":
+            if proxy is not None:
+                return http.client.HTTPConnection(
+                    proxy.hostname, proxy.port or 80, timeout=self.config.timeout
+                )
+            return http.client.HTTPConnection(
+                parts.hostname, parts.port, timeout=self.config.timeout
+            )
 
-        try:
-            ssl_context = None
+        ssl_context = self._ssl_context
+        if ssl_context is None:
             if self.config.verify_tls:
                 ssl_context = ssl.create_default_context(
                     cafile=self.config.ca_bundle_path or None
                 )
             else:
                 ssl_context = ssl._create_unverified_context()  # noqa: SLF001
-
-            with urllib.request.urlopen(req, timeout=self.config.timeout, context=ssl_context) as resp:
-                status = getattr(resp, "status", 200)
-                if status >= 400:
-                    raise RuntimeError(f"API Lens logs ingest returned status={status}")
-        except urllib.error.HTTPError as exc:
-            if 400 <= exc.code < 500 and exc.code != 429:
-                raise RuntimeError(f"Non-retryable logs ingest error status={exc.code}") from exc
-            raise RuntimeError(f"Retryable logs ingest error status={exc.code}") from exc
-        except urllib.error.URLError as exc:
-            raise RuntimeError(f"Logs ingest network error: {exc}") from exc
+            self._ssl_context = ssl_context
+        if proxy is None:
+            return http.client.HTTPSConnection(
+                parts.hostname, parts.port, timeout=self.config.timeout, context=ssl_context
+            )
+        conn = http.client.HTTPSConnection(
+            proxy.hostname, proxy.port or 80, timeout=self.config.timeout, context=ssl_context
+        )
+        conn.set_tunnel(parts.hostname, parts.port, headers=self._proxy_headers or None)
+        return conn
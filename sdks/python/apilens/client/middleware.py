@@ -7,15 +7,20 @@ from typing import Any
 
 from ._capture import (
     CaptureContext,
+    _TeeStream,
     _extract_ip,
-    _extract_user_agent,
-    _headers_to_dict,
+    _is_textual,
     _normalize_path,
     _to_int,
+    build_ctx,
     capture_response,
 )
 from .client import ApiLensClient
 
+_HTTP_REQUEST = "http.request"
+_RESPONSE_START = "http.response.start"
+_RESPONSE_BODY = "http.response.body"
+
 _consumer_ctx: contextvars.ContextVar[dict[str, str] | None] = contextvars.ContextVar(
     "apilens_consumer_ctx",
     default=None,
@@ -56,6 +61,73 @@ def set_consumer(
     track_consumer(request, identifier=identifier, name=name, group=group)
 
 
+class _AsgiExchange:
+    """Per-request receive/send wrappers for the ASGI middleware.
+
+    One slotted object with two bound methods replaces a pair of closures and
+    their cell variables. Captured bytes are appended through memoryviews
+    straight into one buffer per direction: no per-chunk slices and no join.
+    """
+
+    __slots__ = (
+        "_receive",
+        "_send",
+        "_max_bytes",
+        "_capture_request",
+        "_capture_response",
+        "request_payload",
+        "response_payload",
+        "status_code",
+        "response_size",
+    )
+
+    def __init__(
+        self,
+        receive: Callable[[], Awaitable[dict[str, Any]]],
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+        max_bytes: int,
+        *,
+        capture_request: bool,
+        capture_response: bool,
+    ) -> None:
+        self._receive = receive
+        self._send = send
+        self._max_bytes = max_bytes
+        self._capture_request = capture_request
+        self._capture_response = capture_response
+        self.request_payload = bytearray()
+        self.response_payload = bytearray()
+        self.status_code = 500
+        self.response_size = 0
+
+    async def receive(self) -> dict[str, Any]:
+        message = await self._receive()
+        if self._capture_request and message["type"] == _HTTP_REQUEST:
+            body = message.get("body") or b""
+            remaining = self._max_bytes - len(self.request_payload)
+            if body and remaining > 0:
+                self.request_payload.extend(memoryview(body)[:remaining])
+        return message
+
+    async def send(self, message: dict[str, Any]) -> None:
+        msg_type = message["type"]
+        if msg_type == _RESPONSE_START:
+            self.status_code = int(message.get("status") or 500)
+            if self._capture_response:
+                for key, value in message.get("headers") or ():
+                    if key.lower() == b"content-type":
+                        self._capture_response = _is_textual(value.decode("latin-1"))
+                        break
+        elif msg_type == _RESPONSE_BODY:
+            body = message.get("body") or b""
+            self.response_size += len(body)
+            if self._capture_response and body:
+                remaining = self._max_bytes - len(self.response_payload)
+                if remaining > 0:
+                    self.response_payload.extend(memoryview(body)[:remaining])
+        await self._send(message)
+
+
 class ApiLensASGIMiddleware:
     """Generic ASGI middleware for HTTP request capture."""
 
@@ -81,65 +153,32 @@ class ApiLensASGIMiddleware:
         self.max_payload_bytes = max(0, int(max_payload_bytes))
 
     async def __call__(self, scope, receive, send) -> None:
-        if scope.get("type") != "http":
+        if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
 
-        headers = _headers_to_dict(scope.get("headers", []))
-        path = _normalize_path(scope.get("path", "/"))
-
-        request_payload_chunks: list[bytes] = []
-        request_payload_len = 0
+        ctx = build_ctx(
+            scope.get("method"),
+            scope.get("path"),
+            scope.get("headers", []),
+            client_ip=(scope.get("client") or ("", 0))[0] or "",
+        )
 
-        ctx = CaptureContext(
-            method=(scope.get("method") or "GET").upper(),
-            path=path,
-            request_size=_to_int(headers.get("content-length"), 0),
-            ip_address=_extract_ip(headers, fallback=(scope.get("client") or ("", 0))[0] or ""),
-            user_agent=_extract_user_agent(headers),
+        max_bytes = self.max_payload_bytes
+        capture = self.capture_payloads and max_bytes > 0
+        exchange = _AsgiExchange(
+            receive,
+            send,
+            max_bytes,
+            capture_request=capture and self.log_request_body and _is_textual(ctx.content_type),
+            capture_response=capture and self.log_response_body,
         )
 
         started_at = time.perf_counter()
-        status_code = 500
-        response_size = 0
-        response_payload_chunks: list[bytes] = []
-        response_payload_len = 0
         token = _consumer_ctx.set(None)
 
-        async def wrapped_receive():
-            nonlocal request_payload_len
-            message = await receive()
-            if (
-                self.capture_payloads
-                and self.log_request_body
-                and message.get("type") == "http.request"
-                and self.max_payload_bytes > 0
-            ):
-                body = message.get("body") or b""
-                if body and request_payload_len < self.max_payload_bytes:
-                    remaining = self.max_payload_bytes - request_payload_len
-                    part = body[:remaining]
-                    request_payload_chunks.append(part)
-                    request_payload_len += len(part)
-            return message
-
-        async def wrapped_send(message: dict[str, Any]) -> None:
-            nonlocal status_code, response_size, response_payload_len
-            msg_type = message.get("type")
-            if msg_type == "http.response.start":
-                status_code = int(message.get("status") or 500)
-            elif msg_type == "http.response.body":
-                body = message.get("body") or b""
-                response_size += len(body)
-                if self.capture_payloads and self.log_response_body and self.max_payload_bytes > 0 and response_payload_len < self.max_payload_bytes:
-                    remaining = self.max_payload_bytes - response_payload_len
-                    part = body[:remaining]
-                    response_payload_chunks.append(part)
-                    response_payload_len += len(part)
-            await send(message)
-
         try:
-            await self.app(scope, wrapped_receive, wrapped_send)
+            await self.app(scope, exchange.receive, exchange.send)
         finally:
             consumer = _consumer_ctx.get() or {}
             scope_state = scope.get("state")
@@ -147,20 +186,18 @@ class ApiLensASGIMiddleware:
                 state_consumer = scope_state.get("_apilens_consumer")
                 if isinstance(state_consumer, dict):
                     consumer = {**consumer, **state_consumer}
-            request_payload = b"".join(request_payload_chunks).decode("utf-8", errors="replace")
-            response_payload = b"".join(response_payload_chunks).decode("utf-8", errors="replace")
-            ctx.request_payload = request_payload
+            ctx.request_payload = exchange.request_payload
             ctx.consumer_id = str(consumer.get("consumer_id") or "")
             ctx.consumer_name = str(consumer.get("consumer_name") or "")
             ctx.consumer_group = str(consumer.get("consumer_group") or "")
             capture_response(
                 self.client,
                 ctx,
-                status_code=status_code,
-                response_size=response_size,
+                status_code=exchange.status_code,
+                response_size=exchange.response_size,
                 started_at=started_at,
                 environment=self.environment,
-                response_payload=response_payload,
+                response_payload=exchange.response_payload,
             )
             _consumer_ctx.reset(token)
 
@@ -197,26 +234,23 @@ class ApiLensWSGIMiddleware:
         if query:
             path = f"{path}?{query}"
 
-        xff = (environ.get("HTTP_X_FORWARDED_FOR") or "").strip()
-        if xff:
-            ip_address = xff.split(",", 1)[0].strip()
-        else:
-            ip_address = (environ.get("HTTP_X_REAL_IP") or "").strip() or (environ.get("REMOTE_ADDR") or "")
+        ip_address = _extract_ip(
+            environ.get("HTTP_X_FORWARDED_FOR"),
+            environ.get("HTTP_X_REAL_IP"),
+            environ.get("REMOTE_ADDR"),
+        )
 
-        request_payload = ""
-        if self.capture_payloads and self.log_request_body and self.max_payload_bytes > 0:
+        tee = None
+        if (
+            self.capture_payloads
+            and self.log_request_body
+            and self.max_payload_bytes > 0
+            and _is_textual(environ.get("CONTENT_TYPE"))
+        ):
             stream = environ.get("wsgi.input")
             if stream is not None and hasattr(stream, "read"):
-                body = stream.read(self.max_payload_bytes)
-                if body:
-                    request_payload = body.decode("utf-8", errors="replace")
-                # Reset stream so app can consume the same bytes.
-                try:
-                    import io
-
-                    environ["wsgi.input"] = io.BytesIO(body + stream.read())
-                except Exception:
-                    pass
+                tee = _TeeStream(stream, self.max_payload_bytes)
+                environ["wsgi.input"] = tee
 
         ctx = CaptureContext(
             method=(environ.get("REQUEST_METHOD") or "GET").upper(),
@@ -224,17 +258,21 @@ class ApiLensWSGIMiddleware:
             request_size=_to_int(environ.get("CONTENT_LENGTH"), 0),
             ip_address=ip_address,
             user_agent=(environ.get("HTTP_USER_AGENT") or "").strip(),
-            request_payload=request_payload,
         )
 
         status_code = 500
         response_size = 0
-        response_payload_chunks: list[bytes] = []
-        response_payload_len = 0
+        response_payload = bytearray()
+        capture_response_body = self.capture_payloads and self.log_response_body
 
         def wrapped_start_response(status: str, headers: list[tuple[str, str]], exc_info=None):
-            nonlocal status_code
+            nonlocal status_code, capture_response_body
             status_code = _to_int(status.split(" ", 1)[0], 500)
+            if capture_response_body:
+                for key, value in headers:
+                    if key.lower() == "content-type":
+                        capture_response_body = _is_textual(value)
+                        break
             return start_response(status, headers, exc_info)
 
         result = self.app(environ, wrapped_start_response)
@@ -242,18 +280,17 @@ class ApiLensWSGIMiddleware:
         try:
             for chunk in result:
                 response_size += len(chunk or b"")
-                if self.capture_payloads and self.log_response_body and self.max_payload_bytes > 0 and response_payload_len < self.max_payload_bytes:
-                    piece = chunk or b""
-                    remaining = self.max_payload_bytes - response_payload_len
-                    part = piece[:remaining]
-                    response_payload_chunks.append(part)
-                    response_payload_len += len(part)
+                if capture_response_body and chunk:
+                    remaining = self.max_payload_bytes - len(response_payload)
+                    if remaining > 0:
+                        response_payload.extend(memoryview(chunk)[:remaining])
                 yield chunk
         finally:
             close = getattr(result, "close", None)
             if callable(close):
                 close()
-            response_payload = b"".join(response_payload_chunks).decode("utf-8", errors="replace")
+            if tee is not None:
+                ctx.request_payload = tee.captured
             capture_response(
                 self.client,
                 ctx,
@@ -3,6 +3,29 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+_UTC = timezone.utc
+# Already-uppercase methods skip the .upper() call in to_wire.
+_METHODS = {m: m for m in ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS")}
+
+
+def _iso_utc(ts: datetime) -> str:
+    # Fixed YYYY-MM-DDTHH:MM:SS.ffffffZ; naive timestamps are taken as UTC.
+    tzinfo = ts.tzinfo
+    if tzinfo is not None and tzinfo is not _UTC:
+        ts = ts.astimezone(_UTC)
+    return (
+        f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d}T"
+        f"{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}.{ts.microsecond:06d}Z"
+    )
+
+
+def _payload_text(value: bytes | str | None) -> str:
+    # Middleware hands over raw captured bytes; decoding happens here, on the
+    # flush thread, instead of on the request path.
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8", errors="replace")
+    return value or ""
+
 
 @dataclass(slots=True)
 class RequestRecord:
@@ -19,17 +42,11 @@ class RequestRecord:
     consumer_id: str = ""
     consumer_name: str = ""
     consumer_group: str = ""
-    request_payload: str = ""
-    response_payload: str = ""
+    request_payload: bytes | str = ""
+    response_payload: bytes | str = ""
 
     def to_wire(self) -> dict[str, object]:
-        ts = self.timestamp
-        if ts.tzinfo is None:
-            ts = ts.replace(tzinfo=timezone.utc)
-        else:
-            ts = ts.astimezone(timezone.utc)
-
-        iso = ts.isoformat().replace("+00:00", "Z")
+        iso = _iso_utc(self.timestamp)
         path = self.path or "/"
         if not path.startswith("/"):
             path = f"/{path}"
@@ -37,7 +54,7 @@ class RequestRecord:
         return {
             "timestamp": iso,
             "environment": self.environment,
-            "method": (self.method or "GET").upper(),
+            "method": _METHODS.get(self.method) or (self.method or "GET").upper(),
             "path": path,
             "status_code": int(self.status_code),
             "response_time_ms": float(self.response_time_ms),
@@ -48,8 +65,8 @@ class RequestRecord:
             "consumer_id": self.consumer_id or "",
             "consumer_name": self.consumer_name or "",
             "consumer_group": self.consumer_group or "",
-            "request_payload": self.request_payload or "",
-            "response_payload": self.response_payload or "",
+            "request_payload": _payload_text(self.request_payload),
+            "response_payload": _payload_text(self.response_payload),
         }
 
 
@@ -72,13 +89,7 @@ class LogRecord:
     attributes: dict[str, str | int | float | bool] | None = None
 
     def to_wire(self) -> dict[str, object]:
-        ts = self.timestamp
-        if ts.tzinfo is None:
-            ts = ts.replace(tzinfo=timezone.utc)
-        else:
-            ts = ts.astimezone(timezone.utc)
-
-        iso = ts.isoformat().replace("+00:00", "Z")
+        iso = _iso_utc(self.timestamp)
         path = self.endpoint_path or ""
         if path and not path.startswith("/"):
             path = f"/{path}"
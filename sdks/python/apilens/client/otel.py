@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 from opentelemetry import trace
@@ -27,21 +29,59 @@ _HTTP_RESPONSE_SIZE_KEYS = (
 )
 _HTTP_IP_KEYS = ("client.address", "http.client_ip", "net.peer.ip")
 _HTTP_USER_AGENT_KEYS = ("user_agent.original", "http.user_agent")
+_ABSOLUTE_URL_PREFIXES = ("http://", "https://")
+_EXPORTED_KINDS = frozenset((SpanKind.SERVER, SpanKind.CONSUMER))
+_UTC = timezone.utc
+
+# attribute key -> (record field, priority); lower priority wins when a span
+# carries both the current and the legacy semantic-convention key.
+_ATTR_ROUTES: dict[str, tuple[str, int]] = {
+    key: (field, rank)
+    for field, keys in (
+        ("method", _HTTP_METHOD_KEYS),
+        ("path", _HTTP_PATH_KEYS),
+        ("status_code", _HTTP_STATUS_KEYS),
+        ("request_size", _HTTP_REQUEST_SIZE_KEYS),
+        ("response_size", _HTTP_RESPONSE_SIZE_KEYS),
+        ("ip_address", _HTTP_IP_KEYS),
+        ("user_agent", _HTTP_USER_AGENT_KEYS),
+    )
+    for rank, key in enumerate(keys)
+}
 
 
-def _pick_attr(attrs: dict[str, Any], keys: tuple[str, ...], default: Any = None) -> Any:
-    for key in keys:
-        value = attrs.get(key)
-        if value is not None:
-            return value
-    return default
+def _route_attrs(attrs: Mapping[str, Any]) -> dict[str, Any]:
+    picked: dict[str, tuple[int, Any]] = {}
+    for key, value in attrs.items():
+        route = _ATTR_ROUTES.get(key)
+        if route is None or value is None:
+            continue
+        field, rank = route
+        current = picked.get(field)
+        if current is None or rank < current[0]:
+            picked[field] = (rank, value)
+    return {field: value for field, (_, value) in picked.items()}
 
 
 def _normalize_path(raw_path: str | None) -> str:
+    # Almost every path is already clean; hand it back without allocating.
+    if (
+        isinstance(raw_path, str)
+        and raw_path[:1] == "/"
+        and "?" not in raw_path
+        and not raw_path[-1].isspace()
+    ):
+        return raw_path
+    if raw_path and len(raw_path) <= _PATH_CACHE_MAX_LEN:
+        return _normalize_path_cached(raw_path)
+    return _normalize_path_slow(raw_path)
+
+
+def _normalize_path_slow(raw_path: str | None) -> str:
     path = (raw_path or "/").strip()
     if not path:
         return "/"
-    if path.startswith("http://") or path.startswith("https://"):
+    if path.startswith(_ABSOLUTE_URL_PREFIXES):
         # urlparse would pull path but this keeps deps minimal and stable.
         slash_idx = path.find("/", path.find("//") + 2)
         path = path[slash_idx:] if slash_idx != -1 else "/"
@@ -53,6 +93,12 @@ def _normalize_path(raw_path: str | None) -> str:
     return path
 
 
+# Span targets repeat (absolute URLs, paths with the same query string), so the
+# slow path is memoized; long inputs bypass the cache to keep its memory bounded.
+_PATH_CACHE_MAX_LEN = 512
+_normalize_path_cached = lru_cache(maxsize=1024)(_normalize_path_slow)
+
+
 def _coerce_int(value: Any, default: int = 0) -> int:
     if value is None:
         return default
@@ -87,44 +133,37 @@ class ApiLensSpanExporter(SpanExporter):
 
     def export(self, spans: list[ReadableSpan]) -> SpanExportResult:
         records: list[RequestRecord] = []
+        append = records.append
+        environment = self.environment
+        capture_client_ip = self.capture_client_ip
+        capture_user_agent = self.capture_user_agent
 
         for span in spans:
-            if span.kind not in (SpanKind.SERVER, SpanKind.CONSUMER):
+            if span.kind not in _EXPORTED_KINDS:
                 continue
 
-            attrs = dict(span.attributes or {})
-            method = str(_pick_attr(attrs, _HTTP_METHOD_KEYS, "GET")).upper()
-            path = _normalize_path(_pick_attr(attrs, _HTTP_PATH_KEYS, "/"))
-            status_code = _coerce_int(_pick_attr(attrs, _HTTP_STATUS_KEYS, 0), 0)
-
+            fields = _route_attrs(span.attributes or {})
+            get = fields.get
+            path = _normalize_path(get("path", "/"))
             if path.endswith("/ingest/requests"):
                 # Avoid ingest loop if transport is instrumented.
                 continue
 
-            duration_ms = max((span.end_time - span.start_time) / 1_000_000.0, 0.0)
-            timestamp = datetime.fromtimestamp(span.start_time / 1_000_000_000, tz=timezone.utc)
-
-            ip_address = ""
-            if self.capture_client_ip:
-                ip_address = str(_pick_attr(attrs, _HTTP_IP_KEYS, "") or "")
-
-            user_agent = ""
-            if self.capture_user_agent:
-                user_agent = str(_pick_attr(attrs, _HTTP_USER_AGENT_KEYS, "") or "")
-
-            record = RequestRecord(
-                timestamp=timestamp,
-                environment=self.environment,
-                method=method,
-                path=path,
-                status_code=status_code,
-                response_time_ms=duration_ms,
-                request_size=_coerce_int(_pick_attr(attrs, _HTTP_REQUEST_SIZE_KEYS, 0), 0),
-                response_size=_coerce_int(_pick_attr(attrs, _HTTP_RESPONSE_SIZE_KEYS, 0), 0),
-                ip_address=ip_address,
-                user_agent=user_agent,
+            start_time = span.start_time
+            append(
+                RequestRecord(
+                    timestamp=datetime.fromtimestamp(start_time / 1_000_000_000, tz=_UTC),
+                    environment=environment,
+                    method=str(get("method", "GET")).upper(),
+                    path=path,
+                    status_code=_coerce_int(get("status_code", 0), 0),
+                    response_time_ms=max((span.end_time - start_time) / 1_000_000.0, 0.0),
+                    request_size=_coerce_int(get("request_size", 0), 0),
+                    response_size=_coerce_int(get("response_size", 0), 0),
+                    ip_address=str(get("ip_address") or "") if capture_client_ip else "",
+                    user_agent=str(get("user_agent") or "") if capture_user_agent else "",
+                )
             )
-            records.append(record)
 
         if records:
             self.client.capture_many(records)
@@ -1,25 +1,49 @@
 from __future__ import annotations
 
+import threading
 import time
+from collections.abc import Iterable, Iterator
 from typing import Any
 
-from .client._capture import CaptureContext, _normalize_path, _to_int, capture_response
+from .client._capture import (
+    CaptureContext,
+    _extract_ip,
+    _is_textual,
+    _normalize_path,
+    _TeeStream,
+    _to_int,
+    capture_response,
+)
 from .client import ApiLensClient, ApiLensConfig
 
+try:
+    from django.conf import settings
+except ImportError:  # pragma: no cover
+    settings = None
+
 _client_singleton: ApiLensClient | None = None
+_client_lock = threading.Lock()
 
 
 
 def _get_client_from_settings() -> ApiLensClient:
     global _client_singleton
-    if _client_singleton is not None:
+    client = _client_singleton
+    if client is not None:
+        return client
+
+    if settings is None:  # pragma: no cover
+        raise RuntimeError("Django settings are not available")
+
+    # Threaded servers may build several middleware stacks at once; a second
+    # client would start a second flush thread.
+    with _client_lock:
+        if _client_singleton is None:
+            _client_singleton = _build_client()
         return _client_singleton
 
-    try:
-        from django.conf import settings
-    except Exception as exc:  # pragma: no cover
-        raise RuntimeError("Django settings are not available") from exc
 
+def _build_client() -> ApiLensClient:
     api_key = getattr(settings, "APILENS_API_KEY", "")
     if not api_key:
         raise RuntimeError("APILENS_API_KEY is required in Django settings")
@@ -31,8 +55,7 @@ def _get_client_from_settings() -> ApiLensClient:
         batch_size=int(getattr(settings, "APILENS_BATCH_SIZE", 200)),
         flush_interval=float(getattr(settings, "APILENS_FLUSH_INTERVAL", 3.0)),
     )
-    _client_singleton = ApiLensClient(cfg)
-    return _client_singleton
+    return ApiLensClient(cfg)
 
 
 class ApiLensDjangoMiddleware:
@@ -48,41 +71,103 @@ class ApiLensDjangoMiddleware:
         response = None
         status_code = 500
         response_size = 0
-
-        xff = (request.META.get("HTTP_X_FORWARDED_FOR") or "").strip()
-        if xff:
-            ip_address = xff.split(",", 1)[0].strip()
-        else:
-            ip_address = (request.META.get("HTTP_X_REAL_IP") or "").strip() or (request.META.get("REMOTE_ADDR") or "")
+        response_payload: bytes | str = ""
+        deferred = False
 
         ctx = CaptureContext(
             method=(request.method or "GET").upper(),
             path=_normalize_path(getattr(request, "path", "/") or "/"),
             request_size=_to_int(request.META.get("CONTENT_LENGTH"), 0),
-            ip_address=ip_address,
+            ip_address=_extract_ip(
+                request.META.get("HTTP_X_FORWARDED_FOR"),
+                request.META.get("HTTP_X_REAL_IP"),
+                request.META.get("REMOTE_ADDR"),
+            ),
             user_agent=(request.META.get("HTTP_USER_AGENT") or "").strip(),
         )
-        try:
-            body = request.body[: self.max_payload_bytes]
-            ctx.request_payload = body.decode("utf-8", errors="replace")
-        except Exception:
-            ctx.request_payload = ""
+        tee = None
+        if _is_textual(request.META.get("CONTENT_TYPE")):
+            body = getattr(request, "_body", None)
+            stream = getattr(request, "_stream", None)
+            if body is not None:
+                ctx.request_payload = body[: self.max_payload_bytes]
+            elif stream is not None and not getattr(request, "_read_started", False):
+                # Tee the stream rather than touching request.body, which would
+                # read and cache the whole upload before the view runs.
+                tee = _TeeStream(stream, self.max_payload_bytes)
+                request._stream = tee
 
         try:
             response = self.get_response(request)
             status_code = int(getattr(response, "status_code", 500) or 500)
-            content = getattr(response, "content", b"") or b""
-            response_size = len(content)
-            response_payload = (content[: self.max_payload_bytes]).decode("utf-8", errors="replace")
+            capture_body = _is_textual(response.get("Content-Type") if hasattr(response, "get") else "")
+            if getattr(response, "file_to_stream", None) is not None:
+                # FileResponse: replacing streaming_content would drop
+                # file_to_stream and with it the server's sendfile path, so
+                # leave it alone and take the size from Content-Length.
+                response_size = _to_int(response.get("Content-Length"), 0)
+            elif getattr(response, "streaming", False):
+                # Reading .content would drain the stream into memory; measure
+                # chunks as they go out and capture once the stream ends.
+                if not getattr(response, "is_async", False):
+                    response.streaming_content = self._observe_stream(
+                        response.streaming_content,
+                        ctx,
+                        tee,
+                        status_code=status_code,
+                        started_at=started_at,
+                        capture_body=capture_body,
+                    )
+                    deferred = True
+            else:
+                content = getattr(response, "content", b"") or b""
+                response_size = len(content)
+                if capture_body:
+                    response_payload = content[: self.max_payload_bytes]
             return response
         finally:
+            if not deferred:
+                if tee is not None:
+                    ctx.request_payload = tee.captured
+                capture_response(
+                    self.client,
+                    ctx,
+                    status_code=status_code,
+                    response_size=response_size,
+                    started_at=started_at,
+                    response_payload=response_payload,
+                )
+
+    def _observe_stream(
+        self,
+        chunks: Iterable[bytes],
+        ctx: CaptureContext,
+        tee: _TeeStream | None,
+        *,
+        status_code: int,
+        started_at: float,
+        capture_body: bool,
+    ) -> Iterator[bytes]:
+        response_size = 0
+        response_payload = bytearray() if capture_body else b""
+        try:
+            for chunk in chunks:
+                response_size += len(chunk)
+                if capture_body and chunk:
+                    remaining = self.max_payload_bytes - len(response_payload)
+                    if remaining > 0:
+                        response_payload.extend(memoryview(chunk)[:remaining])
+                yield chunk
+        finally:
+            if tee is not None:
+                ctx.request_payload = tee.captured
             capture_response(
                 self.client,
                 ctx,
                 status_code=status_code,
                 response_size=response_size,
                 started_at=started_at,
-                response_payload=locals().get("response_payload", ""),
+                response_payload=response_payload,
             )
 
 
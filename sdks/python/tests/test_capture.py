@@ -0,0 +1,55 @@
+import io
+
+from apilens.client._capture import _TeeStream
+
+
+class _ReadOnlyStream:
+    """A wsgi.input that only implements read()."""
+
+    def __init__(self, data: bytes) -> None:
+        self._buf = io.BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._buf.read(size)
+
+
+def test_read_is_captured_up_to_cap():
+    tee = _TeeStream(io.BytesIO(b"hello world"), 5)
+
+    assert tee.read() == b"hello world"
+    assert bytes(tee.captured) == b"hello"
+
+
+def test_readinto_is_captured():
+    tee = _TeeStream(io.BytesIO(b"hello world"), 64)
+    buffer = bytearray(5)
+
+    assert tee.readinto(buffer) == 5
+    assert bytes(buffer) == b"hello"
+    assert bytes(tee.captured) == b"hello"
+    assert tee.read() == b" world"
+    assert bytes(tee.captured) == b"hello world"
+
+
+def test_readinto_falls_back_to_read():
+    tee = _TeeStream(_ReadOnlyStream(b"abcdef"), 64)
+    buffer = bytearray(4)
+
+    assert tee.readinto(buffer) == 4
+    assert bytes(buffer) == b"abcd"
+    assert bytes(tee.captured) == b"abcd"
+
+
+def test_read1_is_captured():
+    tee = _TeeStream(io.BufferedReader(io.BytesIO(b"xyz")), 64)
+
+    assert tee.read1(2) == b"xy"
+    assert bytes(tee.captured) == b"xy"
+
+
+def test_lines_are_captured():
+    tee = _TeeStream(io.BytesIO(b"a\nb\nc\n"), 64)
+
+    assert tee.readline() == b"a\n"
+    assert list(tee) == [b"b\n", b"c\n"]
+    assert bytes(tee.captured) == b"a\nb\nc\n"
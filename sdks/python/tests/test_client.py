@@ -0,0 +1,140 @@
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from apilens.client import ApiLensClient, ApiLensConfig
+from apilens.client.models import RequestRecord
+
+
+class _IngestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append(self.path)
+        self.server.peers.add(self.client_address)
+        self.send_response(202)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        if self.server.drop_after_response:
+            # Close without "Connection: close", the way an idle keep-alive
+            # connection is dropped by a proxy or load balancer.
+            self.close_connection = True
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def ingest_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _IngestHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.peers = set()
+    server.drop_after_response = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(ingest_server):
+    host, port = ingest_server.server_address
+    client = ApiLensClient(
+        ApiLensConfig(
+            api_key="test-key",
+            base_url=f"http://{host}:{port}/api/v1",
+            max_retries=0,
+            retry_backoff_base=0.0,
+        ),
+        start_worker=False,
+    )
+    yield client
+    client.shutdown(flush=False)
+
+
+def _record() -> RequestRecord:
+    return RequestRecord(
+        timestamp=datetime.now(timezone.utc),
+        environment="test",
+        method="GET",
+        path="/items",
+        status_code=200,
+        response_time_ms=1.5,
+    )
+
+
+def test_batches_reuse_one_connection(client, ingest_server):
+    for _ in range(3):
+        assert client._send_batch_with_retry([_record()])
+
+    assert ingest_server.requests == ["/api/v1/ingest/requests"] * 3
+    assert len(ingest_server.peers) == 1
+
+
+def test_reconnects_after_server_closes_connection(client, ingest_server):
+    ingest_server.drop_after_response = True
+
+    for _ in range(3):
+        assert client._send_batch_with_retry([_record()])
+
+    assert ingest_server.requests == ["/api/v1/ingest/requests"] * 3
+    assert len(ingest_server.peers) == 3
+
+
+def test_shutdown_timeout_keeps_pool_for_flush_thread(ingest_server):
+    # Every in-flight slot is taken by a slow delivery, so the flush thread is
+    # still blocked when shutdown() stops waiting for it.
+    host, port = ingest_server.server_address
+    client = ApiLensClient(
+        ApiLensConfig(
+            api_key="test-key",
+            base_url=f"http://{host}:{port}/api/v1",
+            batch_size=1,
+            flush_interval=0.01,
+        )
+    )
+    release = threading.Event()
+    delivered = []
+
+    def slow_deliver(batch):
+        release.wait()
+        delivered.extend(batch)
+        return len(batch)
+
+    client._deliver = slow_deliver
+    records = [_record() for _ in range(8)]
+    for record in records:
+        client.capture_record(record)
+        time.sleep(0.01)
+
+    threading.Timer(0.3, release.set).start()
+    client.shutdown(timeout=0.05)
+    client._thread.join(timeout=2)
+    assert not client._thread.is_alive()
+
+    # The thread has exited now, so this waits for the pool to drain.
+    client.shutdown(flush=False)
+    assert len(delivered) == len(records)
+
+
+def test_capture_notifies_once_per_filled_batch(client):
+    notified = []
+
+    class _CountingCondition(threading.Condition):
+        def notify(self, n=1):
+            notified.append(n)
+            super().notify(n)
+
+    client._wakeup = _CountingCondition()
+    batch_size = client.config.batch_size
+
+    for _ in range(batch_size * 2):
+        client.capture_record(_record())
+
+    assert len(notified) == 1
@@ -0,0 +1,68 @@
+import io
+
+import pytest
+
+django = pytest.importorskip("django")
+
+from django.conf import settings  # noqa: E402
+
+if not settings.configured:
+    settings.configure(ALLOWED_HOSTS=["*"])
+    django.setup()
+
+from django.http import FileResponse, StreamingHttpResponse  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+
+import apilens.django as apilens_django  # noqa: E402
+from apilens.client import ApiLensClient, ApiLensConfig  # noqa: E402
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = ApiLensClient(ApiLensConfig(api_key="test-key"), start_worker=False)
+    monkeypatch.setattr(apilens_django, "_get_client_from_settings", lambda: client)
+    yield client
+    client.shutdown(flush=False)
+
+
+def _middleware(response):
+    middleware = apilens_django.ApiLensDjangoMiddleware(lambda request: response)
+    middleware.max_payload_bytes = 4
+    return middleware
+
+
+def test_streaming_response_is_captured_when_the_stream_ends(client):
+    middleware = _middleware(
+        StreamingHttpResponse((b"chunk%d" % i for i in range(3)), content_type="text/plain")
+    )
+
+    response = middleware(RequestFactory().get("/items"))
+    assert not client._queue
+
+    assert b"".join(response) == b"chunk0chunk1chunk2"
+    record = client._queue.popleft()
+    assert record.response_size == 18
+    assert record.response_payload == b"chun"
+
+
+def test_binary_stream_payload_is_not_captured(client):
+    middleware = _middleware(
+        StreamingHttpResponse(iter([b"\x00\x01", b"\x02"]), content_type="application/octet-stream")
+    )
+
+    b"".join(middleware(RequestFactory().get("/blob")))
+
+    record = client._queue.popleft()
+    assert record.response_size == 3
+    assert not record.response_payload
+
+
+def test_file_response_keeps_file_to_stream(client):
+    payload = io.BytesIO(b"x" * 10)
+    middleware = _middleware(FileResponse(payload, content_type="text/plain"))
+
+    response = middleware(RequestFactory().get("/download"))
+
+    assert response.file_to_stream is payload
+    record = client._queue.popleft()
+    assert record.response_size == 10